@@ -0,0 +1,34 @@
+"""Lease row for the due-date reminder scheduler
+
+Revision ID: b10_reminder_leases
+Revises: b9_task_owner_cascade
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b10_reminder_leases"
+down_revision: Union[str, Sequence[str], None] = "b9_task_owner_cascade"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reminder_leases",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("holder", sa.String(length=100), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("due_soon_until", sa.DateTime(), nullable=True),
+        sa.Column("overdue_until", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("reminder_leases")
@@ -0,0 +1,42 @@
+"""Task list indexes for admin (all-owner) queries
+
+Revision ID: b12_admin_task_list_indexes
+Revises: b11_revoked_tokens
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b12_admin_task_list_indexes"
+down_revision: Union[str, Sequence[str], None] = "b11_revoked_tokens"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SORT_KEYS = ("created_at", "due_date", "title")
+FILTER_KEYS = ("status", "priority")
+
+
+def _indexes():
+    # The b3 indexes all lead with user_id, which admin lists do not
+    # filter on. ix_tasks_title already covers the unfiltered title sort.
+    for sort_key in SORT_KEYS:
+        if sort_key != "title":
+            yield f"ix_tasks_{sort_key}", [sort_key, "id"]
+        for filter_key in FILTER_KEYS:
+            yield f"ix_tasks_{filter_key}_{sort_key}", [filter_key, sort_key, "id"]
+
+
+def upgrade() -> None:
+    for name, columns in _indexes():
+        op.create_index(name, "tasks", columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, _ in _indexes():
+        op.drop_index(name, table_name="tasks")
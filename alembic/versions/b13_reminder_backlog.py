@@ -0,0 +1,58 @@
+"""Backlog of tasks due inside an already scanned reminder window
+
+Revision ID: b13_reminder_backlog
+Revises: b12_admin_task_list_indexes
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b13_reminder_backlog"
+down_revision: Union[str, Sequence[str], None] = "b12_admin_task_list_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Both sides are stored by the ORM in the same text format, so they
+# compare correctly as strings
+_ALREADY_SCANNED = """
+    NEW.due_date IS NOT NULL
+    AND NEW.due_date <= (
+        SELECT due_soon_until FROM reminder_leases WHERE name = 'due_reminders'
+    )
+"""
+_ENQUEUE = "INSERT OR IGNORE INTO reminder_backlog (task_id) VALUES (NEW.id);"
+
+TRIGGERS = {
+    "tasks_reminder_backlog_insert": f"""
+        CREATE TRIGGER tasks_reminder_backlog_insert AFTER INSERT ON tasks
+        WHEN {_ALREADY_SCANNED}
+        BEGIN {_ENQUEUE} END
+    """,
+    "tasks_reminder_backlog_update": f"""
+        CREATE TRIGGER tasks_reminder_backlog_update AFTER UPDATE OF due_date ON tasks
+        WHEN NEW.due_date IS NOT OLD.due_date AND {_ALREADY_SCANNED}
+        BEGIN {_ENQUEUE} END
+    """,
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reminder_backlog",
+        sa.Column("task_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.PrimaryKeyConstraint("task_id"),
+    )
+    for ddl in TRIGGERS.values():
+        op.execute(ddl)
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.drop_table("reminder_backlog")
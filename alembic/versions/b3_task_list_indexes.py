@@ -0,0 +1,46 @@
+"""Composite indexes for task list queries
+
+Revision ID: b3_task_list_indexes
+Revises: b2_link_tasks_to_users
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3_task_list_indexes"
+down_revision: Union[str, Sequence[str], None] = "b2_link_tasks_to_users"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SORT_KEYS = ("created_at", "due_date", "title")
+FILTER_KEYS = ("status", "priority")
+
+
+def _indexes():
+    for sort_key in SORT_KEYS:
+        yield f"ix_tasks_user_{sort_key}", ["user_id", sort_key, "id"]
+        for filter_key in FILTER_KEYS:
+            yield (
+                f"ix_tasks_user_{filter_key}_{sort_key}",
+                ["user_id", filter_key, sort_key, "id"],
+            )
+
+
+def upgrade() -> None:
+    for name, columns in _indexes():
+        op.create_index(name, "tasks", columns, unique=False)
+    # Every composite index above leads with user_id, so the single-column
+    # index only adds write cost.
+    op.drop_index(op.f("ix_tasks_user_id"), table_name="tasks")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_tasks_user_id"), "tasks", ["user_id"], unique=False)
+    for name, _ in _indexes():
+        op.drop_index(name, table_name="tasks")
@@ -0,0 +1,82 @@
+"""Trigger-maintained task count summary
+
+Revision ID: b4_task_counts
+Revises: b3_task_list_indexes
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b4_task_counts"
+down_revision: Union[str, Sequence[str], None] = "b3_task_list_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_ADD_NEW = """
+    INSERT INTO task_counts (user_id, status, priority, task_count)
+    VALUES (COALESCE(NEW.user_id, 0), NEW.status, NEW.priority, 1)
+    ON CONFLICT (user_id, status, priority)
+    DO UPDATE SET task_count = task_count + 1;
+"""
+
+_REMOVE_OLD = """
+    UPDATE task_counts SET task_count = task_count - 1
+    WHERE user_id = COALESCE(OLD.user_id, 0)
+      AND status = OLD.status
+      AND priority = OLD.priority;
+"""
+
+TRIGGERS = {
+    "tasks_counts_insert": f"""
+        CREATE TRIGGER tasks_counts_insert AFTER INSERT ON tasks
+        BEGIN {_ADD_NEW} END
+    """,
+    "tasks_counts_delete": f"""
+        CREATE TRIGGER tasks_counts_delete AFTER DELETE ON tasks
+        BEGIN {_REMOVE_OLD} END
+    """,
+    "tasks_counts_update": f"""
+        CREATE TRIGGER tasks_counts_update
+        AFTER UPDATE OF user_id, status, priority ON tasks
+        WHEN OLD.user_id IS NOT NEW.user_id
+          OR OLD.status IS NOT NEW.status
+          OR OLD.priority IS NOT NEW.priority
+        BEGIN {_REMOVE_OLD} {_ADD_NEW} END
+    """,
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_counts",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.Enum("todo", "in_progress", "done", name="taskstatus"), nullable=False),
+        sa.Column("priority", sa.Enum("low", "medium", "high", "urgent", name="taskpriority"), nullable=False),
+        sa.Column("task_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "status", "priority"),
+    )
+    op.execute(
+        """
+        INSERT INTO task_counts (user_id, status, priority, task_count)
+        SELECT COALESCE(user_id, 0), status, priority, COUNT(*)
+        FROM tasks
+        GROUP BY COALESCE(user_id, 0), status, priority
+        """
+    )
+    for ddl in TRIGGERS.values():
+        op.execute(ddl)
+
+    op.create_index("ix_tasks_due_date_status", "tasks", ["due_date", "status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_due_date_status", table_name="tasks")
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.drop_table("task_counts")
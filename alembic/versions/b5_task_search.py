@@ -0,0 +1,69 @@
+"""Full-text search index over task title and description
+
+Revision ID: b5_task_search
+Revises: b4_task_counts
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5_task_search"
+down_revision: Union[str, Sequence[str], None] = "b4_task_counts"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_INDEX_NEW = """
+    INSERT INTO tasks_fts (rowid, title, description)
+    VALUES (NEW.id, NEW.title, NEW.description);
+"""
+
+_UNINDEX_OLD = """
+    INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+    VALUES ('delete', OLD.id, OLD.title, OLD.description);
+"""
+
+TRIGGERS = {
+    "tasks_fts_insert": f"""
+        CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks
+        BEGIN {_INDEX_NEW} END
+    """,
+    "tasks_fts_delete": f"""
+        CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks
+        BEGIN {_UNINDEX_OLD} END
+    """,
+    "tasks_fts_update": f"""
+        CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks
+        BEGIN {_UNINDEX_OLD} {_INDEX_NEW} END
+    """,
+}
+
+
+def upgrade() -> None:
+    # External-content FTS5 table: it stores only the inverted index and
+    # reads title/description back from tasks by rowid
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE tasks_fts USING fts5(
+            title,
+            description,
+            content='tasks',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        """
+    )
+    op.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+    for ddl in TRIGGERS.values():
+        op.execute(ddl)
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.execute("DROP TABLE IF EXISTS tasks_fts")
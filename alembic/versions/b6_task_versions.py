@@ -0,0 +1,81 @@
+"""Per-owner task collection versions
+
+Revision ID: b6_task_versions
+Revises: b5_task_search
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6_task_versions"
+down_revision: Union[str, Sequence[str], None] = "b5_task_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _bump(row: str) -> str:
+    return f"""
+        INSERT INTO task_versions (user_id, version, updated_at)
+        VALUES (
+            COALESCE({row}.user_id, 0),
+            (SELECT COALESCE(MAX(version), 0) + 1 FROM task_versions),
+            CURRENT_TIMESTAMP
+        )
+        ON CONFLICT (user_id) DO UPDATE SET
+            version = excluded.version,
+            updated_at = excluded.updated_at;
+    """
+
+
+TRIGGERS = {
+    "tasks_versions_insert": f"""
+        CREATE TRIGGER tasks_versions_insert AFTER INSERT ON tasks
+        BEGIN {_bump("NEW")} END
+    """,
+    "tasks_versions_update": f"""
+        CREATE TRIGGER tasks_versions_update AFTER UPDATE ON tasks
+        BEGIN {_bump("NEW")} END
+    """,
+    "tasks_versions_reassign": f"""
+        CREATE TRIGGER tasks_versions_reassign AFTER UPDATE OF user_id ON tasks
+        WHEN OLD.user_id IS NOT NEW.user_id
+        BEGIN {_bump("OLD")} END
+    """,
+    "tasks_versions_delete": f"""
+        CREATE TRIGGER tasks_versions_delete AFTER DELETE ON tasks
+        BEGIN {_bump("OLD")} END
+    """,
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_versions",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_index("ix_task_versions_version", "task_versions", ["version"], unique=False)
+    op.execute(
+        """
+        INSERT INTO task_versions (user_id, version, updated_at)
+        SELECT COALESCE(user_id, 0), 1, CURRENT_TIMESTAMP
+        FROM tasks
+        GROUP BY COALESCE(user_id, 0)
+        """
+    )
+    for ddl in TRIGGERS.values():
+        op.execute(ddl)
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.drop_index("ix_task_versions_version", table_name="task_versions")
+    op.drop_table("task_versions")
@@ -0,0 +1,70 @@
+"""Task change log for the change feed
+
+Revision ID: b7_task_changes
+Revises: b6_task_versions
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7_task_changes"
+down_revision: Union[str, Sequence[str], None] = "b6_task_versions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _log(row: str, change: str, when: str = "") -> str:
+    return f"""
+        INSERT INTO task_changes (task_id, user_id, op, changed_at)
+        SELECT {row}.id, COALESCE({row}.user_id, 0), '{change}', CURRENT_TIMESTAMP
+        {when};
+    """
+
+
+TRIGGERS = {
+    "tasks_changes_insert": f"""
+        CREATE TRIGGER tasks_changes_insert AFTER INSERT ON tasks
+        BEGIN {_log("NEW", "upsert")} END
+    """,
+    # One trigger so the previous owner's tombstone always precedes the
+    # new owner's upsert
+    "tasks_changes_update": f"""
+        CREATE TRIGGER tasks_changes_update AFTER UPDATE ON tasks
+        BEGIN
+            {_log("OLD", "delete", "WHERE OLD.user_id IS NOT NEW.user_id")}
+            {_log("NEW", "upsert")}
+        END
+    """,
+    "tasks_changes_delete": f"""
+        CREATE TRIGGER tasks_changes_delete AFTER DELETE ON tasks
+        BEGIN {_log("OLD", "delete")} END
+    """,
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_changes",
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("op", sa.String(length=10), nullable=False),
+        sa.Column("changed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("seq"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index("ix_task_changes_user_seq", "task_changes", ["user_id", "seq"], unique=False)
+    for ddl in TRIGGERS.values():
+        op.execute(ddl)
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.drop_index("ix_task_changes_user_seq", table_name="task_changes")
+    op.drop_table("task_changes")
@@ -0,0 +1,35 @@
+"""Indexes for filtered admin user listing
+
+Revision ID: b8_user_list_indexes
+Revises: b7_task_changes
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8_user_list_indexes"
+down_revision: Union[str, Sequence[str], None] = "b7_task_changes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = {
+    "ix_users_role_id": ["role", "id"],
+    "ix_users_is_active_id": ["is_active", "id"],
+    "ix_users_created_at": ["created_at"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES.items():
+        op.create_index(name, "users", columns, unique=False)
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.drop_index(name, table_name="users")
@@ -0,0 +1,61 @@
+"""Cascade task deletes from their owner
+
+Revision ID: b9_task_owner_cascade
+Revises: b8_user_list_indexes
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b9_task_owner_cascade"
+down_revision: Union[str, Sequence[str], None] = "b8_user_list_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FK_NAME = "fk_tasks_user_id_users"
+
+
+def _task_triggers() -> list[str]:
+    rows = op.get_bind().execute(
+        sa.text("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'tasks'")
+    )
+    return [sql for (sql,) in rows]
+
+
+def _rebuild_tasks(alter) -> None:
+    """Run a batch (copy-and-swap) alteration of tasks, keeping its triggers.
+
+    SQLite cannot add or drop a foreign key in place, so Alembic rebuilds
+    the table. Dropping the old table drops the triggers that maintain
+    task_counts, task_versions, tasks_fts and task_changes, so they are
+    captured first and recreated on the new table.
+    """
+    triggers = _task_triggers()
+    with op.batch_alter_table("tasks", recreate="always") as batch_op:
+        alter(batch_op)
+    for ddl in triggers:
+        op.execute(ddl)
+
+
+def upgrade() -> None:
+    # Tasks of users deleted before the constraint existed would fail the
+    # new foreign key; keep them as unowned tasks rather than dropping them
+    op.execute(
+        "UPDATE tasks SET user_id = NULL "
+        "WHERE user_id IS NOT NULL AND user_id NOT IN (SELECT id FROM users)"
+    )
+    _rebuild_tasks(
+        lambda batch_op: batch_op.create_foreign_key(
+            FK_NAME, "users", ["user_id"], ["id"], ondelete="CASCADE"
+        )
+    )
+
+
+def downgrade() -> None:
+    _rebuild_tasks(lambda batch_op: batch_op.drop_constraint(FK_NAME, type_="foreignkey"))
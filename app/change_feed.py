@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import TaskChange
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeNotifier:
+    """Wakes change-feed waiters in this process after any commit.
+
+    Writes made by other workers are only seen on the waiters' next poll,
+    so this shortens latency for local writes without being required for
+    correctness.
+    """
+
+    def __init__(self):
+        self._event = asyncio.Event()
+
+    def notify(self) -> None:
+        event, self._event = self._event, asyncio.Event()
+        event.set()
+
+    async def wait(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+change_notifier = ChangeNotifier()
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_after_commit(session: Session) -> None:
+    change_notifier.notify()
+
+
+async def pruned_through(db: AsyncSession) -> int:
+    """The highest seq removed from the change log, or 0 if none was.
+
+    Only pruning deletes from ``task_changes``, so everything after the
+    oldest retained seq is still there. Once the log is empty,
+    ``sqlite_sequence`` still remembers the last seq handed out.
+    """
+    return (
+        await db.execute(
+            text(
+                "SELECT COALESCE("
+                "(SELECT MIN(seq) - 1 FROM task_changes), "
+                "(SELECT seq FROM sqlite_sequence WHERE name = 'task_changes'), 0)"
+            )
+        )
+    ).scalar_one()
+
+
+class ChangeLogPruner:
+    """Deletes change-log entries older than ``change_feed_retention_seconds``.
+
+    Seqs are handed out in commit order, so the oldest entries are at the
+    front of the primary key: each round looks at the first
+    ``purge_batch_size`` seqs only and stops once a round finds a recent
+    one. Several workers may prune at once; the deletes are idempotent.
+    """
+
+    def __init__(self):
+        self._task: asyncio.Task | None = None
+        self.pruned = 0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.prune()
+            except Exception:
+                logger.exception("Change log prune failed")
+            await asyncio.sleep(settings.change_feed_prune_interval_seconds)
+
+    async def prune(self) -> int:
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.change_feed_retention_seconds)
+        batch_size = settings.purge_batch_size
+        oldest = select(TaskChange.seq).order_by(TaskChange.seq).limit(batch_size)
+        pruned = 0
+        while True:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    delete(TaskChange).where(TaskChange.seq.in_(oldest), TaskChange.changed_at < cutoff)
+                )
+                await session.commit()
+            pruned += result.rowcount
+            if result.rowcount < batch_size:
+                break
+            await asyncio.sleep(settings.purge_pause_seconds)
+        self.pruned += pruned
+        return pruned
+
+    def stats(self) -> dict:
+        return {"pruned": self.pruned}
+
+
+change_log_pruner = ChangeLogPruner()
@@ -4,11 +4,122 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     database_url: str = "sqlite+aiosqlite:///./task_manager.db"
 
+    # Engine profile (see app/database.py)
+    database_echo: bool = False
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30.0
+    database_pool_pre_ping: bool = True
+
+    # PRAGMAs applied to every new SQLite connection; None leaves the
+    # SQLite default in place
+    sqlite_journal_mode: str | None = "WAL"
+    sqlite_synchronous: str | None = "NORMAL"
+    sqlite_busy_timeout_ms: int | None = 5000
+    sqlite_cache_size: int | None = -64000  # negative means KiB, so 64 MiB
+    sqlite_mmap_size: int | None = 256 * 1024 * 1024
+    # Needed for ON DELETE CASCADE on tasks.user_id
+    sqlite_foreign_keys: str | None = "ON"
+
+    # Read engine for get_read_db (see app/database.py): a separate URL such
+    # as a replica, or for file SQLite a second pool on the same file opened
+    # with mode=ro. Unset, reads share the primary engine. A user who
+    # committed a write through this process in the last
+    # read_your_writes_seconds reads from the primary. The pin is per
+    # process: a read served by another worker, or after the window, can
+    # still see a lagging replica.
+    database_read_url: str | None = None
+    sqlite_read_only_pool: bool = False
+    read_your_writes_seconds: float = 5.0
+
     jwt_secret_key: str = "Khuzaima_secret_key"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_minutes: int = 60 * 24 * 7  
 
+    # Key rotation: new tokens are signed with jwt_signing_keys[jwt_active_kid]
+    # and name it in their "kid" header; tokens without a kid are checked
+    # against jwt_secret_key. Drop a kid once its tokens have expired.
+    jwt_signing_keys: dict[str, str] = {}
+    jwt_active_kid: str | None = None
+    # Verified access/refresh token claims, kept until the token expires
+    token_cache_max_size: int = 10_000
+    # How often each worker picks up refresh tokens revoked by the others
+    revocation_reload_seconds: float = 30.0
+
+    # Authenticated principal cache (see app/principals.py)
+    principal_cache_max_size: int = 10_000
+    principal_cache_ttl_seconds: float = 60.0
+
+    # bcrypt cost factor and the worker pool that runs it (see app/passwords.py)
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
+
+    # Maximum number of items accepted by the /tasks/bulk endpoints
+    bulk_max_items: int = 500
+
+    # Maximum number of ids accepted by GET/POST /tasks/batch
+    task_batch_max_ids: int = 500
+
+    # Read status x priority counts for GET /tasks/stats from the
+    # trigger-maintained task_counts table instead of scanning tasks
+    task_stats_use_summary: bool = True
+
+    # Background purges (deleting a user with more tasks than this, or
+    # DELETE /tasks) remove this many tasks per short transaction
+    purge_batch_size: int = 1000
+    purge_pause_seconds: float = 0.05
+
+    # Opt-in write-behind for PATCH /tasks/{task_id} (see app/write_behind.py):
+    # updates are merged in memory and flushed in batches
+    task_write_behind: bool = False
+    task_write_behind_interval_seconds: float = 0.05
+    task_write_behind_max_batch: int = 500
+
+    # Response cache for GET /tasks: "memory" (per-process LRU) or "none"
+    response_cache_backend: str = "memory"
+    response_cache_max_entries: int = 2048
+
+    # Change feed long-poll / SSE (GET /tasks/changes)
+    change_feed_max_wait_seconds: float = 30.0
+    change_feed_poll_interval_seconds: float = 1.0
+    change_feed_heartbeat_seconds: float = 15.0
+    # Change-log entries older than this are pruned every
+    # change_feed_prune_interval_seconds; 0 keeps them forever
+    change_feed_retention_seconds: float = 7 * 24 * 3600.0
+    change_feed_prune_interval_seconds: float = 600.0
+
+    # Token-bucket rate limits (see app/rate_limit.py): "memory" (per
+    # process), "sqlite" (a file shared by the workers on one host) or "none".
+    # Values are "<requests>/<second|minute|hour>" for "METHOD /route" keys,
+    # with "user" and "ip" as the defaults for other routes
+    rate_limit_backend: str = "memory"
+    rate_limit_sqlite_path: str = "./rate_limits.db"
+    rate_limits: dict[str, str] = {
+        "user": "600/minute",
+        "ip": "120/minute",
+        "POST /auth/login": "10/minute",
+        "POST /auth/register": "5/minute",
+    }
+    # Reverse proxies (addresses or CIDRs) whose X-Forwarded-For is trusted
+    # for the "ip" bucket; otherwise every client behind them shares one
+    rate_limit_trusted_proxies: list[str] = []
+
+    # Due-date reminders (see app/reminders.py). reminder_sink is "log",
+    # "webhook" (POSTs JSON to reminder_webhook_url), "queue" or "none"
+    reminders_enabled: bool = True
+    reminder_sink: str = "log"
+    reminder_webhook_url: str | None = None
+    reminder_queue_max_size: int = 10_000
+    reminder_lead_minutes: float = 60.0
+    reminder_poll_seconds: float = 30.0
+    reminder_lease_seconds: float = 90.0
+    reminder_batch_size: int = 500
+
+    # Request/SQL/bcrypt instrumentation and the GET /metrics endpoint
+    metrics_enabled: bool = True
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
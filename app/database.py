@@ -1,16 +1,176 @@
+import time
+
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.sql.dml import UpdateBase
 from app.config import settings
+from app.metrics import instrument_engine
+
+
+def _engine_options(database_url: str) -> dict:
+    url = make_url(database_url)
+    options = {
+        "echo": settings.database_echo,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+    }
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        # In-memory databases use a single shared connection (StaticPool)
+        if url.database in (None, "", ":memory:"):
+            return options
+
+    options.update(
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+    )
+    return options
+
+
+def _sqlite_pragmas(read_only: bool = False) -> list[str]:
+    pragmas = {
+        # The journal mode belongs to the file and is set by the primary
+        "journal_mode": None if read_only else settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+        "cache_size": settings.sqlite_cache_size,
+        "mmap_size": settings.sqlite_mmap_size,
+        "foreign_keys": settings.sqlite_foreign_keys,
+        "query_only": "ON" if read_only else None,
+    }
+    return [
+        f"PRAGMA {name}={value}"
+        for name, value in pragmas.items()
+        if value is not None
+    ]
+
+
+def _read_database_url() -> str | None:
+    """URL for the read engine, or None to read through the primary."""
+    if settings.database_read_url:
+        return settings.database_read_url
+    url = make_url(settings.database_url)
+    if (
+        settings.sqlite_read_only_pool
+        and url.get_backend_name() == "sqlite"
+        and url.database not in (None, "", ":memory:")
+    ):
+        url = url.set(
+            database=f"file:{url.database}",
+            query={**url.query, "mode": "ro", "uri": "true"},
+        )
+        return url.render_as_string(hide_password=False)
+    return None
+
+
+def _create_engine(database_url: str, read_only: bool = False):
+    new_engine = create_async_engine(database_url, **_engine_options(database_url))
+
+    if new_engine.dialect.name == "sqlite":
+
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in _sqlite_pragmas(read_only):
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
+    if settings.metrics_enabled:
+        instrument_engine(new_engine)
+    return new_engine
+
+
+engine = _create_engine(settings.database_url)
+
+_read_url = _read_database_url()
+read_engine = _create_engine(_read_url, read_only=True) if _read_url else engine
+
+
+class PrimaryPins:
+    """Users who committed a write recently and must read from the primary.
+
+    Keeps read-your-writes within this process while the read engine lags
+    behind (a replica); other workers do not see the pin. Expired entries
+    are swept once per window.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self._until: dict[int, float] = {}
+        self._next_sweep = 0.0
+
+    def pin(self, user_id: int | None) -> None:
+        if user_id is None:
+            return
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._until = {key: until for key, until in self._until.items() if until > now}
+            self._next_sweep = now + self.seconds
+        self._until[user_id] = now + self.seconds
+
+    def is_pinned(self, user_id: int | None) -> bool:
+        until = self._until.get(user_id)
+        return until is not None and until > time.monotonic()
+
+
+primary_pins = PrimaryPins(settings.read_your_writes_seconds)
+
+
+class PrimarySession(Session):
+    pass
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _pin_writer(session):
+    # get_current_user tags the request's session with the caller's id
+    primary_pins.pin(session.info.get("user_id"))
+
+
+class RoutingSession(Session):
+    """Reads from the read engine; writes and pinned sessions use the primary.
+
+    The choice is made per statement until the session holds a connection
+    for that engine, so a pin taken before the first query wins.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if (
+            self._flushing
+            or isinstance(clause, UpdateBase)
+            or self.info.get("pinned")
+            or primary_pins.is_pinned(self.info["primary_info"].get("user_id"))
+        ):
+            return engine.sync_engine
+        return read_engine.sync_engine
+
+
+def read_session(user_id: int | None = None) -> AsyncSession:
+    """Standalone read session, for streams that outlive the request."""
+    return ReadSessionLocal(info={"primary_info": {"user_id": user_id}})
+
+
+def pin_to_primary(session: AsyncSession) -> None:
+    """Send the rest of ``session``'s reads to the primary (read-your-writes)."""
+    session.info["pinned"] = True
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=True, 
-    connect_args={"check_same_thread": False} 
-)
 
 AsyncSessionLocal = async_sessionmaker(
     engine, 
     class_=AsyncSession, 
+    sync_session_class=PrimarySession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False
+)
+
+ReadSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False
@@ -21,6 +181,22 @@ class Base(DeclarativeBase):
 
 async def get_db():
     async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+async def get_read_db(primary: AsyncSession = Depends(get_db)):
+    """Session for read-mostly endpoints, routed to the read engine.
+
+    Depends on get_db so it can see which user the request authenticated
+    as (get_current_user shares that session); without a read engine it
+    simply is that session.
+    """
+    if read_engine is engine:
+        yield primary
+        return
+    async with ReadSessionLocal(info={"primary_info": primary.info}) as session:
         try:
             yield session
         finally:
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Job:
+    """Progress of one background job, as reported to admins."""
+
+    id: str
+    kind: str
+    status: str = "pending"  # pending, running, done, failed or cancelled
+    total: int | None = None
+    processed: int = 0
+    error: str | None = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: datetime | None = None
+
+
+class JobRegistry:
+    """Runs background jobs on the event loop and remembers their progress.
+
+    Jobs live in this process only: they are cancelled on shutdown and a
+    job started by one worker is not visible from another. Only the most
+    recent ``max_finished`` finished jobs are kept.
+    """
+
+    def __init__(self, max_finished: int = 100):
+        self.max_finished = max_finished
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def start(
+        self, kind: str, work: Callable[[Job], Awaitable[None]], total: int | None = None
+    ) -> Job:
+        job = Job(id=uuid.uuid4().hex, kind=kind, total=total)
+        self._jobs[job.id] = job
+        self._tasks[job.id] = asyncio.create_task(self._run(job, work))
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def running(self, kind: str) -> Job | None:
+        """Return an unfinished job of ``kind``, if there is one."""
+        for job_id in self._tasks:
+            job = self._jobs[job_id]
+            if job.kind == kind:
+                return job
+        return None
+
+    async def _run(self, job: Job, work: Callable[[Job], Awaitable[None]]) -> None:
+        job.status = "running"
+        try:
+            await work(job)
+            job.status = "done"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        except Exception as exc:
+            logger.exception("Background job %s (%s) failed", job.id, job.kind)
+            job.status = "failed"
+            job.error = str(exc)
+        finally:
+            job.finished_at = datetime.utcnow()
+            self._tasks.pop(job.id, None)
+            self._prune()
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id in self._jobs if job_id not in self._tasks]
+        for job_id in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+job_registry = JobRegistry()
@@ -1,16 +1,90 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+
+from app import metrics
+from app.change_feed import change_log_pruner
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.jobs import job_registry
+from app.passwords import password_pool
+from app.principals import principal_cache
+from app.rate_limit import get_rate_limit_backend
+from app.reminders import reminder_scheduler
+from app.response_cache import get_response_cache
 from app.routers import task_router, auth_router, admin_router
+from app.tokens import revocation_list, token_cache
+from app.write_behind import task_write_buffer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with AsyncSessionLocal() as db:
+        await revocation_list.sync(db, force=True)
+    if settings.reminders_enabled:
+        reminder_scheduler.start()
+    if settings.task_write_behind:
+        task_write_buffer.start()
+    if settings.change_feed_retention_seconds > 0:
+        change_log_pruner.start()
+    yield
+    # Drain buffered PATCHes before anything else shuts down
+    await task_write_buffer.stop()
+    await reminder_scheduler.stop()
+    await change_log_pruner.stop()
+    await job_registry.shutdown()
+    password_pool.shutdown()
+
 
 app = FastAPI(
     title="Task Manager API",
     description="A robust REST API for managing tasks with advanced filtering, sorting, and pagination.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.include_router(auth_router)
 app.include_router(admin_router)
 app.include_router(task_router)
 
+if settings.metrics_enabled:
+    app.add_middleware(metrics.MetricsMiddleware)
+    metrics.registry.register_stats(
+        "principal_cache", principal_cache.stats, counters=("hits", "misses")
+    )
+    metrics.registry.register_stats(
+        "response_cache",
+        lambda: get_response_cache().stats(),
+        counters=("hits", "misses", "evictions", "invalidations"),
+    )
+    metrics.registry.register_stats(
+        "password_pool",
+        lambda: {"pending": password_pool.pending, "rejected": password_pool.rejected},
+        counters=("rejected",),
+    )
+    metrics.registry.register_stats(
+        "token_cache", token_cache.stats, counters=("hits", "misses")
+    )
+    metrics.registry.register_stats("revoked_refresh_tokens", revocation_list.stats)
+    metrics.registry.register_stats(
+        "rate_limit",
+        lambda: get_rate_limit_backend().stats(),
+        counters=("rejected", "busy"),
+    )
+    metrics.registry.register_stats(
+        "task_write_behind", task_write_buffer.stats, counters=("flushes", "merged")
+    )
+    metrics.registry.register_stats(
+        "change_log", change_log_pruner.stats, counters=("pruned",)
+    )
+
+    @app.get("/metrics", include_in_schema=False)
+    async def prometheus_metrics():
+        return PlainTextResponse(
+            metrics.registry.render(), media_type="text/plain; version=0.0.4"
+        )
+
 
 @app.get("/", tags=["Root"])
 async def root():
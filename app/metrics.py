@@ -0,0 +1,271 @@
+"""In-process request, database and bcrypt metrics in Prometheus text format.
+
+Everything is recorded on the event loop thread with plain dict/list
+updates, so there are no locks and the cost per request is a handful of
+``perf_counter`` calls. Per-request SQL statement counts ride on a
+ContextVar that SQLAlchemy's greenlet bridge carries into engine events.
+"""
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+
+def _format_labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", r"\\").replace('"', r"\""))
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def dec(self, *labels, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels, value: float) -> None:
+        self._values[labels] = value
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, value: float, *labels) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def samples(self) -> Iterable[str]:
+        names = self.labels + ("le",)
+        for labels, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket{_format_labels(names, labels + (_format_value(bound),))}"
+                    f" {cumulative}"
+                )
+            suffix = _format_labels(self.labels, labels)
+            yield f"{self.name}_sum{suffix} {_format_value(series[-1])}"
+            yield f"{self.name}_count{suffix} {cumulative}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: list = []
+        self._stats: list[tuple[str, Callable[[], dict], frozenset]] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_stats(
+        self, prefix: str, stats: Callable[[], dict], counters: Iterable[str] = ()
+    ) -> None:
+        """Export a component's ``stats()`` dict at scrape time.
+
+        Numeric keys become ``{prefix}_{key}`` gauges; keys listed in
+        ``counters`` are exported as ``{prefix}_{key}_total`` counters.
+        """
+        self._stats.append((prefix, stats, frozenset(counters)))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        for prefix, stats, counters in self._stats:
+            for key, value in stats().items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                if key in counters:
+                    name, kind = f"{prefix}_{key}_total", "counter"
+                else:
+                    name, kind = f"{prefix}_{key}", "gauge"
+                lines.append(f"# TYPE {name} {kind}")
+                lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.register(Counter(
+    "http_requests_total", "HTTP requests handled", ("method", "route", "status")
+))
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "Time to the last response byte", ("method", "route")
+))
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled", ("method",)
+))
+http_request_statements = registry.register(Histogram(
+    "http_request_db_statements", "SQL statements issued per HTTP request",
+    ("method", "route"), buckets=STATEMENT_BUCKETS,
+))
+http_request_db_time = registry.register(Histogram(
+    "http_request_db_seconds", "Time spent executing SQL per HTTP request", ("method", "route")
+))
+db_statements = registry.register(Counter(
+    "db_statements_total", "SQL statements executed"
+))
+db_statement_duration = registry.register(Histogram(
+    "db_statement_duration_seconds", "SQL statement execution time"
+))
+db_statement_errors = registry.register(Counter(
+    "db_statement_errors_total", "SQL statements that raised", ("error",)
+))
+db_pool_wait = registry.register(Histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection"
+))
+password_work_duration = registry.register(Histogram(
+    "password_hash_duration_seconds", "bcrypt hashing and verification time", ("operation",)
+))
+
+
+class _RequestStats:
+    __slots__ = ("statements", "db_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+
+
+_request_stats: ContextVar[_RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time every SQL statement and pool checkout on ``engine``."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+    def _record(started: list) -> None:
+        elapsed = time.perf_counter() - started.pop()
+        db_statements.inc()
+        db_statement_duration.observe(elapsed)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_seconds += elapsed
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_execute(conn, cursor, statement, parameters, context, executemany):
+        _record(conn.info["metrics_started"])
+
+    # A statement that raises never reaches after_cursor_execute, so pop
+    # its start time here or the stack grows for the connection's lifetime
+    @event.listens_for(sync_engine, "handle_error")
+    def _execute_failed(exception_context):
+        conn = exception_context.connection
+        started = conn.info.get("metrics_started") if conn is not None else None
+        if started:
+            _record(started)
+            db_statement_errors.inc(type(exception_context.original_exception).__name__)
+
+    # The pool has no "checkout started" event, so time the engine's
+    # raw_connection() (which every Connection goes through) instead
+    raw_connection = sync_engine.raw_connection
+
+    def _timed_raw_connection():
+        started = time.perf_counter()
+        try:
+            return raw_connection()
+        finally:
+            db_pool_wait.observe(time.perf_counter() - started)
+
+    sync_engine.raw_connection = _timed_raw_connection
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-route latency and SQL usage.
+
+    Routes are labelled by their path template (``/tasks/{task_id}``), and
+    requests that match no route share one ``unmatched`` label so clients
+    cannot blow up the series count.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        stats = _RequestStats()
+        token = _request_stats.set(stats)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_stats.reset(token)
+            http_requests_in_flight.dec(method)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            http_requests.inc(method, path, status_code)
+            http_request_duration.observe(elapsed, method, path)
+            http_request_statements.observe(stats.statements, method, path)
+            http_request_db_time.observe(stats.db_seconds, method, path)
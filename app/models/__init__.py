@@ -1,2 +1,9 @@
+from app.models.reminder_backlog import ReminderBacklog
+from app.models.reminder_lease import ReminderLease
+from app.models.revoked_token import RevokedToken
 from app.models.task import Task
+from app.models.task_change import TaskChange
+from app.models.task_count import TaskCount
+from app.models.task_search import tasks_fts
+from app.models.task_version import TaskVersion
 from app.models.user import User, UserRole
\ No newline at end of file
@@ -0,0 +1,16 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+
+class ReminderBacklog(Base):
+    """Tasks that landed inside a due_soon window already scanned.
+
+    Filled by SQLite triggers (see the b13_reminder_backlog migration) when
+    a task is created, or its due date changed, to fall due at or before
+    ``reminder_leases.due_soon_until``. The scheduler drains it every tick,
+    so those tasks still get their due_soon reminder.
+    """
+
+    __tablename__ = "reminder_backlog"
+
+    task_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
\ No newline at end of file
@@ -0,0 +1,23 @@
+from datetime import datetime
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+
+class ReminderLease(Base):
+    """Lease and progress of the due-date reminder scheduler.
+
+    Only the worker named in ``holder`` scans for reminders, until
+    ``expires_at``; it renews the lease on every tick and any worker may
+    take it over once it lapses. The ``*_until`` watermarks record how far
+    each reminder window has been scanned, so a new holder carries on
+    where the previous one stopped.
+    """
+
+    __tablename__ = "reminder_leases"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    holder: Mapped[str] = mapped_column(String(100))
+    expires_at: Mapped[datetime]
+    due_soon_until: Mapped[datetime | None] = mapped_column(default=None)
+    overdue_until: Mapped[datetime | None] = mapped_column(default=None)
\ No newline at end of file
@@ -0,0 +1,18 @@
+from datetime import datetime
+from sqlalchemy import Index, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+
+class RevokedToken(Base):
+    """A refresh token that may no longer be exchanged, by its ``jti``.
+
+    Rows are kept until the token would have expired anyway.
+    """
+
+    __tablename__ = "revoked_tokens"
+    __table_args__ = (Index("ix_revoked_tokens_revoked_at", "revoked_at"),)
+
+    jti: Mapped[str] = mapped_column(String(32), primary_key=True)
+    expires_at: Mapped[datetime]
+    revoked_at: Mapped[datetime] = mapped_column(server_default=func.now())
\ No newline at end of file
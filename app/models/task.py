@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import String, func, ForeignKey
+from sqlalchemy import String, func, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from app.database import Base
 
@@ -18,12 +18,46 @@ class TaskPriority(str, enum.Enum):
     urgent = "urgent"
 
 
+# Composite indexes matching the GET /tasks query shapes: owner, optional
+# status/priority filter, then the sort key with id as tie-breaker. They let
+# SQLite walk the index in order instead of sorting in a temp B-tree.
+# Admins list across all owners, so each shape also has a variant without
+# user_id (for title, the plain ix_tasks_title already is (title, rowid)).
+_LIST_SORT_KEYS = ("created_at", "due_date", "title")
+
+
+def _list_indexes() -> tuple:
+    indexes = []
+    for sort_key in _LIST_SORT_KEYS:
+        indexes.append(Index(f"ix_tasks_user_{sort_key}", "user_id", sort_key, "id"))
+        if sort_key != "title":
+            indexes.append(Index(f"ix_tasks_{sort_key}", sort_key, "id"))
+        for filter_key in ("status", "priority"):
+            indexes.append(
+                Index(
+                    f"ix_tasks_user_{filter_key}_{sort_key}",
+                    "user_id",
+                    filter_key,
+                    sort_key,
+                    "id",
+                )
+            )
+            indexes.append(
+                Index(f"ix_tasks_{filter_key}_{sort_key}", filter_key, sort_key, "id")
+            )
+    # Due-date windows across all owners (dashboard stats, reminders)
+    indexes.append(Index("ix_tasks_due_date_status", "due_date", "status"))
+    return tuple(indexes)
+
+
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = _list_indexes()
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int | None] = mapped_column(
-        ForeignKey("users.id"), index=True, nullable=True
+        ForeignKey("users.id", ondelete="CASCADE", name="fk_tasks_user_id_users"),
+        nullable=True,
     )
     title: Mapped[str] = mapped_column(String(200), index=True)
     description: Mapped[str | None] = mapped_column(default=None)
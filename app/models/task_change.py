@@ -0,0 +1,26 @@
+from datetime import datetime
+from sqlalchemy import Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+
+class TaskChange(Base):
+    """Append-only log of task writes, read by GET /tasks/changes.
+
+    Rows are written by SQLite triggers (see the b7_task_changes migration):
+    ``upsert`` for inserts and updates, ``delete`` tombstones for deletes and
+    for the previous owner when a task is reassigned. ``seq`` is an
+    AUTOINCREMENT key, so it only ever grows.
+    """
+
+    __tablename__ = "task_changes"
+    __table_args__ = (
+        Index("ix_task_changes_user_seq", "user_id", "seq"),
+        {"sqlite_autoincrement": True},
+    )
+
+    seq: Mapped[int] = mapped_column(primary_key=True)
+    task_id: Mapped[int]
+    user_id: Mapped[int]
+    op: Mapped[str] = mapped_column(String(10))
+    changed_at: Mapped[datetime]
\ No newline at end of file
@@ -0,0 +1,19 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+from app.models.task import TaskStatus, TaskPriority
+
+
+class TaskCount(Base):
+    """Per-owner task counts by status and priority.
+
+    Maintained incrementally by SQLite triggers on ``tasks`` (see the
+    b4_task_counts migration). Tasks without an owner are counted under
+    ``user_id`` 0 so the composite key never contains NULL.
+    """
+
+    __tablename__ = "task_counts"
+
+    user_id: Mapped[int] = mapped_column(primary_key=True)
+    status: Mapped[TaskStatus] = mapped_column(primary_key=True)
+    priority: Mapped[TaskPriority] = mapped_column(primary_key=True)
+    task_count: Mapped[int] = mapped_column(default=0)
\ No newline at end of file
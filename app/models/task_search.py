@@ -0,0 +1,12 @@
+from sqlalchemy import column, table
+
+# FTS5 index over tasks.title and tasks.description, created and kept in
+# sync by triggers in the b5_task_search migration. It is a lightweight
+# table construct rather than a mapped model so that create_all and
+# autogenerate leave the virtual table alone.
+tasks_fts = table(
+    "tasks_fts",
+    column("rowid"),
+    column("title"),
+    column("description"),
+)
\ No newline at end of file
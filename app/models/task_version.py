@@ -0,0 +1,21 @@
+from datetime import datetime
+from sqlalchemy import Index
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+
+class TaskVersion(Base):
+    """Version stamp of each owner's task collection.
+
+    Bumped by SQLite triggers on every insert, update and delete of a task
+    (see the b6_task_versions migration). Versions come from one global
+    sequence, so the highest version is also the version of the whole
+    table. Tasks without an owner are tracked under ``user_id`` 0.
+    """
+
+    __tablename__ = "task_versions"
+    __table_args__ = (Index("ix_task_versions_version", "version"),)
+
+    user_id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int]
+    updated_at: Mapped[datetime]
\ No newline at end of file
@@ -1,9 +1,13 @@
 import enum
 from datetime import datetime
-from sqlalchemy import String, Boolean, func
-from sqlalchemy.orm import Mapped, mapped_column
+from typing import TYPE_CHECKING, List
+from sqlalchemy import String, Boolean, Index, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.task import Task
+
 
 class UserRole(str, enum.Enum):
     user = "user"
@@ -12,6 +16,13 @@ class UserRole(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    # GET /admin/users pages in id order; each filter gets an index that
+    # hands rows back already in that order (email prefixes use ix_users_email)
+    __table_args__ = (
+        Index("ix_users_role_id", "role", "id"),
+        Index("ix_users_is_active_id", "is_active", "id"),
+        Index("ix_users_created_at", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
@@ -21,3 +32,9 @@ class User(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now())
+
+    # tasks.user_id is ON DELETE CASCADE, so deleting a user never loads or
+    # deletes task rows through the ORM (passive_deletes)
+    tasks: Mapped[List["Task"]] = relationship(
+        cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
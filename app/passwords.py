@@ -0,0 +1,76 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from app.config import settings
+from app.metrics import password_work_duration
+
+T = TypeVar("T")
+
+
+class PasswordPoolSaturated(Exception):
+    """Raised when too much password work is already queued."""
+
+
+def _timed(fn: Callable[..., T], *args) -> tuple[T, float]:
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+class PasswordWorkPool:
+    """Bounded thread pool for bcrypt hashing and verification.
+
+    bcrypt releases the GIL while it works, so running it in threads keeps
+    the event loop responsive. ``max_pending`` caps running plus queued
+    jobs; beyond that callers are rejected instead of piling up. With
+    ``workers=0`` the work runs inline on the event loop.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="bcrypt"
+            )
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        if self.workers <= 0:
+            result, elapsed = _timed(fn, *args)
+            password_work_duration.observe(elapsed, fn.__name__)
+            return result
+
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordPoolSaturated()
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, elapsed = await loop.run_in_executor(
+                self._get_executor(), _timed, fn, *args
+            )
+        finally:
+            self.pending -= 1
+        # Recorded here on the event loop rather than in the worker thread
+        password_work_duration.observe(elapsed, fn.__name__)
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_pool = PasswordWorkPool(
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
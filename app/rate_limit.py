@@ -0,0 +1,245 @@
+"""Token-bucket rate limiting keyed by user id or client IP.
+
+Limits are read from ``settings.rate_limits``, where each value is
+``"<requests>/<second|minute|hour>"``. A ``"METHOD /route/template"`` key
+gives that route its own bucket. Other routes share the ``"user"`` bucket
+(authenticated callers) or the ``"ip"`` bucket (anonymous ones). Each
+limit allows a burst of ``requests`` and refills at ``requests / period``.
+"""
+import ipaddress
+import math
+import sqlite3
+import threading
+import time
+
+from fastapi import HTTPException, Request, status
+
+from app.config import settings
+
+PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0}
+
+
+def parse_limit(spec: str) -> tuple[float, float]:
+    """Turn ``"10/minute"`` into ``(capacity, tokens per second)``."""
+    count, _, period = spec.partition("/")
+    capacity = float(count)
+    return capacity, capacity / PERIODS[period.strip()]
+
+
+class RateLimitBackend:
+    """Bucket storage. ``hit`` takes one token and returns 0.0 when allowed,
+    or the seconds until a token is available."""
+
+    def hit(self, key: str, capacity: float, rate: float) -> float:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {}
+
+
+class NullRateLimitBackend(RateLimitBackend):
+    def hit(self, key: str, capacity: float, rate: float) -> float:
+        return 0.0
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Per-process buckets in a dict; state is not shared between workers.
+
+    Idle buckets are swept every ``sweep_interval`` seconds. A bucket that
+    has refilled completely is the same as a missing one, so it is dropped.
+    """
+
+    def __init__(self, sweep_interval: float = 60.0):
+        self.sweep_interval = sweep_interval
+        # key -> [tokens, last refill (monotonic), tokens per second, capacity]
+        self._buckets: dict[str, list] = {}
+        self._next_sweep = time.monotonic() + sweep_interval
+        self.rejected = 0
+
+    def hit(self, key: str, capacity: float, rate: float) -> float:
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = [capacity - 1, now, rate, capacity]
+            return 0.0
+
+        tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+        if tokens >= 1:
+            bucket[0] = tokens - 1
+            return 0.0
+        bucket[0] = tokens
+        self.rejected += 1
+        return (1 - tokens) / rate
+
+    def _sweep(self, now: float) -> None:
+        self._next_sweep = now + self.sweep_interval
+        idle = [
+            key for key, (tokens, last, rate, capacity) in self._buckets.items()
+            if tokens + (now - last) * rate >= capacity
+        ]
+        for key in idle:
+            del self._buckets[key]
+
+    def stats(self) -> dict:
+        return {"buckets": len(self._buckets), "rejected": self.rejected}
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """Buckets in a local SQLite file so every worker on a host shares them.
+
+    Each allowed hit is one conditional upsert. The file is separate from
+    the application database so limiter writes never queue behind task
+    writes. Rows idle for ``max_idle_seconds`` (longer than any limit
+    period) are deleted every ``sweep_interval`` seconds.
+
+    ``hit`` runs on the event loop, so it never waits for another worker's
+    write lock: with no busy timeout a locked file fails straight away and
+    the request is allowed (fail open), counted in ``busy``.
+    """
+
+    def __init__(self, path: str, sweep_interval: float = 60.0, max_idle_seconds: float = 3600.0):
+        self.sweep_interval = sweep_interval
+        self.max_idle_seconds = max_idle_seconds
+        self._next_sweep = time.time() + sweep_interval
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("PRAGMA busy_timeout=0")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.busy = 0
+
+    def hit(self, key: str, capacity: float, rate: float) -> float:
+        try:
+            return self._hit(key, capacity, rate)
+        except sqlite3.OperationalError as exc:
+            if exc.sqlite_errorcode not in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED):
+                raise
+            self.busy += 1
+            return 0.0
+
+    def _hit(self, key: str, capacity: float, rate: float) -> float:
+        now = time.time()
+        params = {"key": key, "capacity": capacity, "rate": rate, "now": now}
+        with self._lock:
+            if now >= self._next_sweep:
+                self._next_sweep = now + self.sweep_interval
+                self._conn.execute(
+                    "DELETE FROM rate_limit_buckets WHERE updated < ?",
+                    (now - self.max_idle_seconds,),
+                )
+            allowed = self._conn.execute(
+                """
+                INSERT INTO rate_limit_buckets (key, tokens, updated)
+                VALUES (:key, :capacity - 1, :now)
+                ON CONFLICT (key) DO UPDATE SET
+                    tokens = MIN(:capacity, tokens + (:now - updated) * :rate) - 1,
+                    updated = :now
+                WHERE MIN(:capacity, tokens + (:now - updated) * :rate) >= 1
+                RETURNING tokens
+                """,
+                params,
+            ).fetchone()
+            if allowed is not None:
+                return 0.0
+            row = self._conn.execute(
+                "SELECT tokens, updated FROM rate_limit_buckets WHERE key = :key", params
+            ).fetchone()
+        self.rejected += 1
+        tokens = min(capacity, row[0] + (now - row[1]) * rate)
+        return max(0.0, (1 - tokens) / rate)
+
+    def stats(self) -> dict:
+        return {"rejected": self.rejected, "busy": self.busy}
+
+
+def _build_backend() -> RateLimitBackend:
+    if settings.rate_limit_backend == "memory":
+        return InMemoryRateLimitBackend()
+    if settings.rate_limit_backend == "sqlite":
+        return SQLiteRateLimitBackend(settings.rate_limit_sqlite_path)
+    return NullRateLimitBackend()
+
+
+rate_limit_backend: RateLimitBackend = _build_backend()
+_trusted_proxies = tuple(
+    ipaddress.ip_network(proxy, strict=False) for proxy in settings.rate_limit_trusted_proxies
+)
+_limits: dict[str, tuple[float, float]] = {
+    key: parse_limit(spec) for key, spec in settings.rate_limits.items()
+}
+
+
+def set_rate_limit_backend(backend: RateLimitBackend) -> None:
+    """Swap in another backend, e.g. one shared between workers."""
+    global rate_limit_backend
+    rate_limit_backend = backend
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    return rate_limit_backend
+
+
+def check_rate_limit(request: Request, scope: str, identity) -> None:
+    """Take a token for ``identity`` or raise 429 with Retry-After.
+
+    ``scope`` is "user" or "ip", the default limit used when the route
+    has no limit of its own.
+    """
+    route = request.scope.get("route")
+    route_key = f"{request.method} {route.path}" if route is not None else None
+    limit = _limits.get(route_key)
+    if limit is not None:
+        key = f"{scope}:{identity}:{route_key}"
+    else:
+        limit = _limits.get(scope)
+        if limit is None:
+            return
+        key = f"{scope}:{identity}"
+
+    retry_after = rate_limit_backend.hit(key, *limit)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _trusted_proxies)
+
+
+def client_ip(request: Request) -> str:
+    """The caller's address, looking through trusted reverse proxies.
+
+    X-Forwarded-For is only believed when the socket peer is a trusted
+    proxy, and then read right to left past further trusted hops, so a
+    client cannot pick its own bucket by sending the header itself.
+    """
+    address = request.client.host if request.client else "unknown"
+    if not _trusted_proxies or not _is_trusted_proxy(address):
+        return address
+    forwarded = request.headers.get("x-forwarded-for", "")
+    for hop in reversed([part.strip() for part in forwarded.split(",") if part.strip()]):
+        address = hop
+        if not _is_trusted_proxy(hop):
+            break
+    return address
+
+
+async def limit_by_ip(request: Request) -> None:
+    """Dependency for unauthenticated routes, keyed by the client address."""
+    check_rate_limit(request, "ip", client_ip(request))
@@ -0,0 +1,310 @@
+"""Due-date reminders, scanned by one worker at a time.
+
+Each tick the scheduler reads two time windows off ``ix_tasks_due_date_status``:
+
+* ``due_soon``: open tasks whose due date entered the next
+  ``reminder_lead_minutes`` since the last scan
+* ``overdue``: open tasks whose due date passed since the last scan
+
+Only the window since the previous scan is read, so every reminder is sent
+once per crossing instead of re-polling every task. A task created, or
+rescheduled, to fall due inside a due_soon window that was already scanned
+(e.g. "due in 30 minutes" with a 60-minute lead) is recorded in
+``reminder_backlog`` by a trigger and gets its due_soon reminder from the
+next tick. A task that is already overdue when created or rescheduled gets
+no reminder for that crossing, and neither does a done task that is
+reopened inside a scanned window. Between ticks it sleeps
+until the next due date crosses a window boundary (capped at
+``reminder_poll_seconds``, so new tasks are still picked up). A lease row in
+``reminder_leases`` makes sure only one worker scans when several are
+running. Delivery is at-least-once: a worker that dies after emitting but
+before saving its watermark causes repeats.
+"""
+import asyncio
+import json
+import logging
+import os
+import socket
+import urllib.request
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import ReminderBacklog, ReminderLease, Task
+from app.models.task import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+LEASE_NAME = "due_reminders"
+
+
+@dataclass(frozen=True, slots=True)
+class ReminderEvent:
+    kind: str  # "due_soon" or "overdue"
+    task_id: int
+    user_id: int | None
+    title: str
+    due_date: datetime
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["due_date"] = self.due_date.isoformat()
+        return data
+
+
+class ReminderSink:
+    """Where reminder events go. Subclasses override ``emit``."""
+
+    async def emit(self, events: list[ReminderEvent]) -> None:
+        raise NotImplementedError
+
+
+class NullReminderSink(ReminderSink):
+    async def emit(self, events: list[ReminderEvent]) -> None:
+        pass
+
+
+class LogReminderSink(ReminderSink):
+    async def emit(self, events: list[ReminderEvent]) -> None:
+        for event in events:
+            logger.info(
+                "Task %s %s (user %s, due %s): %s",
+                event.task_id, event.kind, event.user_id, event.due_date, event.title,
+            )
+
+
+class WebhookReminderSink(ReminderSink):
+    """POST each batch as ``{"events": [...]}`` JSON to a URL."""
+
+    def __init__(self, url: str, timeout: float = 10.0):
+        self.url = url
+        self.timeout = timeout
+
+    def _post(self, body: bytes) -> None:
+        request = urllib.request.Request(
+            self.url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    async def emit(self, events: list[ReminderEvent]) -> None:
+        body = json.dumps({"events": [event.to_dict() for event in events]}).encode("utf-8")
+        await asyncio.to_thread(self._post, body)
+
+
+class QueueReminderSink(ReminderSink):
+    """Hand events to in-process consumers through an ``asyncio.Queue``.
+
+    When the queue is full new events are dropped (and counted) rather than
+    stalling the scheduler.
+    """
+
+    def __init__(self, max_size: int):
+        self.queue: asyncio.Queue[ReminderEvent] = asyncio.Queue(max_size)
+        self.dropped = 0
+
+    async def emit(self, events: list[ReminderEvent]) -> None:
+        for event in events:
+            try:
+                self.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.dropped += 1
+
+
+def _build_sink() -> ReminderSink:
+    if settings.reminder_sink == "log":
+        return LogReminderSink()
+    if settings.reminder_sink == "webhook" and settings.reminder_webhook_url:
+        return WebhookReminderSink(settings.reminder_webhook_url)
+    if settings.reminder_sink == "queue":
+        return QueueReminderSink(settings.reminder_queue_max_size)
+    return NullReminderSink()
+
+
+reminder_sink: ReminderSink = _build_sink()
+
+
+def set_reminder_sink(sink: ReminderSink) -> None:
+    global reminder_sink
+    reminder_sink = sink
+
+
+def get_reminder_sink() -> ReminderSink:
+    return reminder_sink
+
+
+def _open_tasks_due_after(stmt, after: datetime):
+    return stmt.where(Task.due_date > after, Task.status != TaskStatus.done)
+
+
+class ReminderScheduler:
+    def __init__(self):
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self._release()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                delay = await self.tick()
+            except Exception:
+                logger.exception("Reminder scan failed")
+                delay = settings.reminder_poll_seconds
+            await asyncio.sleep(delay)
+
+    async def _acquire(self, db: AsyncSession, now: datetime):
+        """Take or renew the lease; return the watermarks, or None if held elsewhere."""
+        stmt = sqlite_insert(ReminderLease).values(
+            name=LEASE_NAME,
+            holder=self.holder,
+            expires_at=now + timedelta(seconds=settings.reminder_lease_seconds),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ReminderLease.name],
+            set_={"holder": stmt.excluded.holder, "expires_at": stmt.excluded.expires_at},
+            where=or_(ReminderLease.holder == self.holder, ReminderLease.expires_at < now),
+        ).returning(ReminderLease.due_soon_until, ReminderLease.overdue_until)
+        row = (await db.execute(stmt)).first()
+        await db.commit()
+        return row
+
+    async def _release(self) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(ReminderLease)
+                .where(ReminderLease.name == LEASE_NAME, ReminderLease.holder == self.holder)
+                .values(expires_at=datetime.utcnow())
+            )
+            await db.commit()
+
+    async def _scan(
+        self, db: AsyncSession, kind: str, after: datetime, until: datetime
+    ) -> tuple[list[ReminderEvent], datetime]:
+        """Read one window; return its events and how far it was covered.
+
+        A full batch stops short of its last due date, so tasks sharing
+        that due date are all picked up together by the next scan.
+        """
+        limit = settings.reminder_batch_size
+        stmt = _open_tasks_due_after(
+            select(Task.id, Task.user_id, Task.title, Task.due_date), after
+        )
+        stmt = stmt.where(Task.due_date <= until).order_by(Task.due_date).limit(limit)
+        rows = (await db.execute(stmt)).all()
+        if len(rows) == limit:
+            cut = rows[-1].due_date
+            complete = [row for row in rows if row.due_date < cut]
+            if complete:
+                rows, until = complete, complete[-1].due_date
+            else:
+                until = cut
+        events = [ReminderEvent(kind, row.id, row.user_id, row.title, row.due_date) for row in rows]
+        return events, until
+
+    async def _read_backlog(
+        self, db: AsyncSession, now: datetime, scanned_until: datetime | None
+    ) -> tuple[list[ReminderEvent], list[int]]:
+        """due_soon events for tasks that landed inside the scanned window.
+
+        Also returns every backlog id read, to be removed with the watermark
+        update whether or not it still qualified (the task may since have
+        been finished, deleted or moved out of the window).
+        """
+        rows = (
+            await db.execute(
+                select(ReminderBacklog.task_id, Task.user_id, Task.title, Task.due_date, Task.status)
+                .outerjoin(Task, Task.id == ReminderBacklog.task_id)
+                .limit(settings.reminder_batch_size)
+            )
+        ).all()
+        events = [
+            ReminderEvent("due_soon", row.task_id, row.user_id, row.title, row.due_date)
+            for row in rows
+            if scanned_until is not None
+            and row.due_date is not None
+            and row.status != TaskStatus.done
+            and now < row.due_date <= scanned_until
+        ]
+        return events, [row.task_id for row in rows]
+
+    async def tick(self) -> float:
+        """Run one scan if this worker holds the lease; return seconds to sleep."""
+        now = datetime.utcnow()
+        lead = timedelta(minutes=settings.reminder_lead_minutes)
+        poll = settings.reminder_poll_seconds
+
+        async with AsyncSessionLocal() as db:
+            lease = await self._acquire(db, now)
+            if lease is None:
+                return poll
+
+            # A fresh lease starts from now instead of replaying history
+            due_soon, due_soon_until = await self._scan(
+                db, "due_soon", lease.due_soon_until or now, now + lead
+            )
+            overdue, overdue_until = await self._scan(
+                db, "overdue", lease.overdue_until or now, now
+            )
+            late, backlog_ids = await self._read_backlog(db, now, lease.due_soon_until)
+            # The next due dates past each window, to sleep until they cross
+            next_due_soon = await db.scalar(
+                _open_tasks_due_after(select(func.min(Task.due_date)), due_soon_until)
+            )
+            next_overdue = await db.scalar(
+                _open_tasks_due_after(select(func.min(Task.due_date)), overdue_until)
+            )
+            await db.close()
+
+            if late or due_soon or overdue:
+                await get_reminder_sink().emit(late + due_soon + overdue)
+
+            await db.execute(
+                update(ReminderLease)
+                .where(ReminderLease.name == LEASE_NAME, ReminderLease.holder == self.holder)
+                .values(due_soon_until=due_soon_until, overdue_until=overdue_until)
+            )
+            if backlog_ids:
+                await db.execute(
+                    delete(ReminderBacklog).where(ReminderBacklog.task_id.in_(backlog_ids))
+                )
+            await db.commit()
+
+        if (
+            due_soon_until < now + lead
+            or overdue_until < now
+            or len(backlog_ids) == settings.reminder_batch_size
+        ):
+            return 0  # a batch was full, keep going
+        wake_at = [
+            moment for moment in (
+                next_due_soon - lead if next_due_soon else None,
+                next_overdue,
+            )
+            if moment is not None
+        ]
+        if not wake_at:
+            return poll
+        return min(poll, max(0.0, (min(wake_at) - now).total_seconds()))
+
+
+reminder_scheduler = ReminderScheduler()
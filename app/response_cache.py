@@ -0,0 +1,139 @@
+from collections import OrderedDict
+
+from app.config import settings
+
+ALL_OWNERS = "all"
+
+
+def owner_tag(user_id: int | None) -> str:
+    return f"user:{user_id or 0}"
+
+
+class ResponseCache:
+    """Interface for caching serialized JSON response bodies.
+
+    Entries carry tags (the owner scope they were computed for) so writes
+    can drop exactly the entries they affect. Subclass this to back the
+    cache with an external store; install it with ``set_response_cache``.
+    """
+
+    def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    def set(self, key: str, body: bytes, tags: tuple[str, ...]) -> None:
+        raise NotImplementedError
+
+    def invalidate_tags(self, *tags: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {}
+
+    def invalidate_owner(self, user_id: int | None) -> None:
+        """Drop entries for one owner's tasks and every all-owner listing."""
+        self.invalidate_tags(owner_tag(user_id), ALL_OWNERS)
+
+
+class NullResponseCache(ResponseCache):
+    def get(self, key: str) -> bytes | None:
+        return None
+
+    def set(self, key: str, body: bytes, tags: tuple[str, ...]) -> None:
+        pass
+
+    def invalidate_tags(self, *tags: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Per-process LRU of response bodies with a tag index."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[str, tuple[bytes, tuple[str, ...]]] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: str, body: bytes, tags: tuple[str, ...]) -> None:
+        if self.max_entries <= 0:
+            return
+        self._discard(key)
+        self._entries[key] = (body, tags)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+
+    def invalidate_tags(self, *tags: str) -> None:
+        for tag in tags:
+            for key in self._keys_by_tag.pop(tag, set()):
+                if self._discard(key):
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _discard(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        for tag in entry[1]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+        return True
+
+
+def _build_cache() -> ResponseCache:
+    if settings.response_cache_backend == "memory":
+        return InMemoryResponseCache(settings.response_cache_max_entries)
+    return NullResponseCache()
+
+
+response_cache: ResponseCache = _build_cache()
+
+
+def set_response_cache(cache: ResponseCache) -> None:
+    """Swap in another backend, e.g. one shared between workers."""
+    global response_cache
+    response_cache = cache
+
+
+def get_response_cache() -> ResponseCache:
+    return response_cache
\ No newline at end of file
@@ -1,22 +1,156 @@
-from typing import List
+import asyncio
+import base64
+import json
+from datetime import datetime, timezone
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from sqlalchemy import String, delete, func, select, type_coerce, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.config import settings
+from app.database import AsyncSessionLocal, get_db, get_read_db, read_session
+from app.jobs import Job, job_registry
+from app.models import Task, TaskCount
 from app.models.user import User, UserRole
+from app.principals import principal_cache
+from app.response_cache import get_response_cache
 from app.routers.auth import CurrentUser
-from app.schemas.user import UserResponse
+from app.schemas.job import JobResponse
+from app.schemas.user import UserListItem, UserPage
+from app.write_behind import task_write_buffer
 
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
-@router.get("/users", response_model=List[UserResponse])
+USER_LIST_FIELDS = tuple(UserListItem.model_fields)
+USER_EXPORT_CHUNK_ROWS = 500
+
+
+def _encode_user_cursor(last_id: int) -> str:
+    raw = json.dumps([last_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_user_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        (last_id,) = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return int(last_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def _stored_timestamp(value: datetime) -> str:
+    """Format a bound the way SQLite's CURRENT_TIMESTAMP stores created_at."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(sep=" ")
+
+
+def _user_list_query(
+    role: Optional[UserRole],
+    is_active: Optional[bool],
+    email_prefix: Optional[str],
+    created_after: Optional[datetime],
+    created_before: Optional[datetime],
+    after_id: Optional[int],
+):
+    """Users in id order with their task totals, in one grouped statement.
+
+    Users are read in id order (through the filter's index when there is
+    one) and each is joined to its few task_counts rows, so with a LIMIT
+    SQLite stops after one page instead of aggregating every user first.
+    """
+    if settings.task_stats_use_summary:
+        task_count = func.coalesce(func.sum(TaskCount.task_count), 0)
+        join_target, on = TaskCount, TaskCount.user_id == User.id
+    else:
+        task_count = func.count(Task.id)
+        join_target, on = Task, Task.user_id == User.id
+
+    columns = [
+        getattr(User, name) for name in USER_LIST_FIELDS if name != "task_count"
+    ]
+    stmt = (
+        select(*columns, task_count.label("task_count"))
+        .outerjoin(join_target, on)
+        .group_by(User.id)
+        .order_by(User.id)
+    )
+
+    if role is not None:
+        stmt = stmt.where(User.role == role)
+    if is_active is not None:
+        stmt = stmt.where(User.is_active == is_active)
+    if email_prefix:
+        # A half-open range instead of LIKE so the email index is used
+        upper = email_prefix[:-1] + chr(ord(email_prefix[-1]) + 1)
+        stmt = stmt.where(User.email >= email_prefix, User.email < upper)
+    if created_after is not None:
+        stmt = stmt.where(
+            type_coerce(User.created_at, String) >= _stored_timestamp(created_after)
+        )
+    if created_before is not None:
+        stmt = stmt.where(
+            type_coerce(User.created_at, String) < _stored_timestamp(created_before)
+        )
+    if after_id is not None:
+        stmt = stmt.where(User.id > after_id)
+    return stmt
+
+
+async def _user_ndjson(stmt):
+    """Stream users as NDJSON from a server-side cursor on a fresh session."""
+    async with read_session() as session:
+        result = await session.stream(
+            stmt.execution_options(yield_per=USER_EXPORT_CHUNK_ROWS)
+        )
+        async for partition in result.partitions():
+            items = [
+                UserListItem.model_validate(dict(zip(USER_LIST_FIELDS, row)))
+                for row in partition
+            ]
+            yield "".join(item.model_dump_json() + "\n" for item in items)
+
+
+USER_PAGE_DEFAULT_LIMIT = 50
+
+
+@router.get("/users", response_model=Union[List[UserListItem], UserPage])
 async def list_users(
     current_user: CurrentUser,
-    db: AsyncSession = Depends(get_db),
+    role: Optional[UserRole] = Query(None, description="Filter by role"),
+    is_active: Optional[bool] = Query(None, description="Filter by active flag"),
+    email_prefix: Optional[str] = Query(
+        None, min_length=1, description="Only emails starting with this (case-sensitive)"
+    ),
+    created_after: Optional[datetime] = Query(
+        None, description="Only users created at or after this time (UTC)"
+    ),
+    created_before: Optional[datetime] = Query(
+        None, description="Only users created before this time (UTC)"
+    ),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=500,
+        description="Users per page; returns a {items, next_cursor} page instead of a list",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    format: str = Query(
+        "json",
+        pattern="^(json|ndjson)$",
+        description="'json' for a list (or one page), 'ndjson' to stream every match",
+    ),
+    db: AsyncSession = Depends(get_read_db),
 ):
     if current_user.role != UserRole.admin:
         raise HTTPException(
@@ -24,11 +158,62 @@ async def list_users(
             detail="Admin access required",
         )
 
-    result = await db.execute(select(User))
-    return result.scalars().all()
+    after_id = _decode_user_cursor(cursor) if cursor is not None else None
+    stmt = _user_list_query(
+        role, is_active, email_prefix, created_after, created_before, after_id
+    )
+
+    if format == "ndjson":
+        return StreamingResponse(_user_ndjson(stmt), media_type="application/x-ndjson")
+
+    if limit is None and cursor is None:
+        # Without limit/cursor, keep the original bare list of every user
+        result = await db.execute(stmt)
+        return [dict(zip(USER_LIST_FIELDS, row)) for row in result.all()]
+
+    limit = limit or USER_PAGE_DEFAULT_LIMIT
+    # Fetch one extra row to learn whether another page exists
+    result = await db.execute(stmt.limit(limit + 1))
+    rows = result.all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_user_cursor(rows[-1].id)
+    return UserPage(
+        items=[dict(zip(USER_LIST_FIELDS, row)) for row in rows],
+        next_cursor=next_cursor,
+    )
+
+
+async def _purge_user(job: Job, user_id: int) -> None:
+    """Delete a user's tasks in bounded batches, then the user.
 
+    Each batch is its own short transaction, with a pause in between, so
+    other writers are never blocked for long.
+    """
+    batch_size = settings.purge_batch_size
+    batch = select(Task.id).where(Task.user_id == user_id).limit(batch_size)
+    while True:
+        task_write_buffer.discard_owner(user_id)
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(delete(Task).where(Task.id.in_(batch)))
+            await session.commit()
+        job.processed += result.rowcount
+        get_response_cache().invalidate_owner(user_id)
+        if result.rowcount < batch_size:
+            break
+        await asyncio.sleep(settings.purge_pause_seconds)
 
-@router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(User).where(User.id == user_id))
+        await session.commit()
+
+
+@router.delete(
+    "/users/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
+)
 async def delete_user(
     user_id: int,
     current_user: CurrentUser,
@@ -40,12 +225,64 @@ async def delete_user(
             detail="Admin access required",
         )
 
-    user = await db.get(User, user_id)
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+    user_not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+    )
+    # Their buffered task updates would only hit deleted rows
+    task_write_buffer.discard_owner(user_id)
+    task_total = await db.scalar(
+        select(func.coalesce(func.sum(TaskCount.task_count), 0)).where(
+            TaskCount.user_id == user_id
         )
+    )
+
+    if task_total > settings.purge_batch_size:
+        # Too many tasks for one transaction: lock the account out now and
+        # purge its tasks in the background
+        result = await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=False)
+            .returning(User.id)
+        )
+        if result.first() is None:
+            raise user_not_found
+        await db.commit()
+        principal_cache.invalidate(user_id)
+
+        async def purge(job: Job) -> None:
+            await _purge_user(job, user_id)
 
-    await db.delete(user)
+        job = job_registry.start("purge_user", purge, total=task_total)
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=JobResponse.model_validate(job).model_dump(mode="json"),
+        )
+
+    # tasks.user_id is ON DELETE CASCADE, so this one statement removes the
+    # user's tasks too without loading them
+    result = await db.execute(
+        delete(User).where(User.id == user_id).returning(User.id)
+    )
+    if result.first() is None:
+        raise user_not_found
     await db.commit()
+    principal_cache.invalidate(user_id)
+    get_response_cache().invalidate_owner(user_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
 
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, current_user: CurrentUser):
+    if current_user.role != UserRole.admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
+
+    job = job_registry.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+        )
+    return job
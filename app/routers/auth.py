@@ -1,14 +1,18 @@
 from typing import Annotated
 from datetime import datetime, timedelta
 import bcrypt
-from jose import JWTError, jwt
-from fastapi import APIRouter, Depends, HTTPException, status
+from jose import JWTError
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
 from app.database import get_db
 from app.models.user import User, UserRole
+from app.passwords import PasswordPoolSaturated, password_pool
+from app.principals import Principal, principal_cache
+from app.rate_limit import check_rate_limit, limit_by_ip
+from app.tokens import decode_token, encode_token, new_token_id, revocation_list
 from app.schemas.user import (
     UserCreate,
     UserLogin,
@@ -18,13 +22,15 @@ from app.schemas.user import (
 )
 
 
-router = APIRouter(prefix="/auth", tags=["Auth"])
+router = APIRouter(prefix="/auth", tags=["Auth"], dependencies=[Depends(limit_by_ip)])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
 def hash_password(password: str) -> str:
     """Hash a plain-text password using bcrypt."""
-    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+    hashed = bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    )
     return hashed.decode("utf-8")
 
 
@@ -35,16 +41,25 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+async def _run_password_work(fn, *args):
+    """Run bcrypt work on the password pool, or fail fast with 503."""
+    try:
+        return await password_pool.run(fn, *args)
+    except PasswordPoolSaturated:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please retry",
+            headers={"Retry-After": "1"},
+        )
+
+
 def _create_token(
     data: dict, expires_delta: timedelta, token_type: str
 ) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + expires_delta
     to_encode.update({"exp": expire, "type": token_type})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
-    )
-    return encoded_jwt
+    return encode_token(to_encode)
 
 
 def create_access_token(data: dict) -> str:
@@ -55,9 +70,11 @@ def create_access_token(data: dict) -> str:
 
 
 def create_refresh_token(data: dict) -> str:
-    """Create a signed JWT refresh token."""
+    """Create a signed JWT refresh token with a ``jti`` so it can be revoked."""
     return _create_token(
-        data, timedelta(minutes=settings.refresh_token_expire_minutes), "refresh"
+        {**data, "jti": new_token_id()},
+        timedelta(minutes=settings.refresh_token_expire_minutes),
+        "refresh",
     )
 
 
@@ -80,7 +97,9 @@ async def register_user(user_in: UserCreate, db: DBSession):
             detail="Email is already registered",
         )
 
-    hashed_pw = hash_password(user_in.password)
+    # Give the connection back to the pool while bcrypt runs
+    await db.close()
+    hashed_pw = await _run_password_work(hash_password, user_in.password)
 
     new_user = User(
         email=user_in.email,
@@ -102,7 +121,11 @@ async def login(user_in: UserLogin, db: DBSession):
     result = await db.execute(select(User).where(User.email == user_in.email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(user_in.password, user.hashed_password):
+    # Give the connection back to the pool while bcrypt runs
+    await db.close()
+    if not user or not await _run_password_work(
+        verify_password, user_in.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -137,11 +160,7 @@ async def refresh_token(
     )
 
     try:
-        payload = jwt.decode(
-            token_request.refresh_token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        payload = decode_token(token_request.refresh_token)
         token_type = payload.get("type")
         sub = payload.get("sub")
         if token_type != "refresh" or sub is None:
@@ -149,10 +168,26 @@ async def refresh_token(
     except JWTError:
         raise credentials_exception
 
+    jti = payload.get("jti")
+    if jti is not None:
+        await revocation_list.sync(db)
+        if revocation_list.is_revoked(jti):
+            raise credentials_exception
+
     user = await db.get(User, int(sub))
     if not user or not user.is_active:
         raise credentials_exception
 
+    # Rotate: the presented refresh token cannot be exchanged again. The
+    # insert decides, so a concurrent exchange of the same token loses
+    if jti is not None:
+        revoked = await revocation_list.revoke(
+            db, jti, datetime.utcfromtimestamp(payload["exp"])
+        )
+        await db.commit()
+        if not revoked:
+            raise credentials_exception
+
     new_access_token = create_access_token(
         data={"sub": str(user.id), "role": user.role.value}
     )
@@ -165,21 +200,35 @@ async def refresh_token(
     )
 
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(token_request: TokenRefreshRequest, db: DBSession):
+    """Revoke a refresh token. Access tokens stay valid until they expire."""
+    try:
+        payload = decode_token(token_request.refresh_token)
+    except JWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate refresh token",
+        )
+
+    if payload.get("type") == "refresh" and payload.get("jti") is not None:
+        await revocation_list.revoke(
+            db, payload["jti"], datetime.utcfromtimestamp(payload["exp"])
+        )
+        await db.commit()
+
+
 async def get_current_user(
     db: DBSession,
     token: str = Depends(oauth2_scheme),
-) -> User:
+) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        payload = decode_token(token)
         token_type = payload.get("type")
         sub = payload.get("sub")
         if token_type != "access" or sub is None:
@@ -187,12 +236,31 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user = await db.get(User, int(sub))
-    if user is None or not user.is_active:
+    user_id = int(sub)
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        user = await db.get(User, user_id)
+        if user is None:
+            raise credentials_exception
+        principal = Principal.from_user(user)
+        principal_cache.put(principal)
+
+    if not principal.is_active:
         raise credentials_exception
 
-    return user
+    # Commits on this request's session pin the user to the primary for
+    # read-your-writes (see app/database.py)
+    db.info["user_id"] = principal.id
+    return principal
+
+
+async def get_rate_limited_user(
+    request: Request,
+    principal: Principal = Depends(get_current_user),
+) -> Principal:
+    check_rate_limit(request, "user", principal.id)
+    return principal
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_rate_limited_user)]
 
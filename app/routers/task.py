@@ -1,17 +1,212 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import asyncio
+import base64
+import csv
+import enum
+import io
+import json
+import time
+from datetime import datetime, timedelta
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    status,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, asc, delete
-from typing import List, Optional
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import (
+    String,
+    select,
+    desc,
+    asc,
+    delete,
+    insert,
+    update,
+    case,
+    func,
+    and_,
+    tuple_,
+    literal,
+    literal_column,
+    text,
+    type_coerce,
+)
+from typing import List, Optional, Union
+
+from pydantic import TypeAdapter
 
-from app.database import get_db
+from app.change_feed import change_notifier, pruned_through
+from app.conditional import is_not_modified, make_etag, not_modified, set_validators
+from app.config import settings
+from app.database import AsyncSessionLocal, get_db, get_read_db, read_session
+from app.jobs import Job, job_registry
 from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.task_change import TaskChange
+from app.models.task_count import TaskCount
+from app.models.task_search import tasks_fts
+from app.models.task_version import TaskVersion
 from app.models.user import UserRole
+from app.principals import Principal
+from app.response_cache import ALL_OWNERS, get_response_cache, owner_tag
 from app.routers.auth import CurrentUser
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.schemas.job import JobResponse
+from app.schemas.task import (
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskPage,
+    TaskRow,
+    TaskRowPage,
+    TaskBulkUpdate,
+    TaskBulkResult,
+    TaskBulkResponse,
+    TaskBatchResult,
+    TaskBatchResponse,
+    TaskStatusPriorityCount,
+    TaskStats,
+    TaskSearchHit,
+    TaskChangeEvent,
+    TaskChangeFeed,
+)
+from app.write_behind import task_write_buffer
 
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+# Sort keys supported by cursor pagination. Each is paired with Task.id as a
+# tie-breaker so the (sort key, id) pair is unique and totally ordered.
+CURSOR_SORT_COLUMNS = {
+    "created_at": Task.created_at,
+    "due_date": Task.due_date,
+    "title": Task.title,
+}
+
+
+def _encode_cursor(sort_by: str, order: str, value, last_id: int) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat(sep=" ")
+    raw = json.dumps([sort_by, order, value, last_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_by: str, order: str):
+    invalid_cursor = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid pagination cursor",
+    )
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort_by, cursor_order, value, last_id = json.loads(
+            base64.urlsafe_b64decode(padded.encode("ascii"))
+        )
+        if value is not None and not isinstance(value, str):
+            raise TypeError("cursor sort key must be a string")
+        last_id = int(last_id)
+    except (ValueError, TypeError):
+        raise invalid_cursor
+
+    if cursor_sort_by != sort_by or cursor_order != order:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor does not match the requested sort_by/order",
+        )
+    return value, last_id
+
+
+def _keyset_segments(sort_column, descending: bool, cursor_key):
+    """Return one WHERE clause per remaining segment of the keyset order.
+
+    SQLite sorts NULLs first in ascending order and last in descending
+    order. Putting an ``OR sort_key IS NULL`` into a single predicate would
+    stop SQLite from seeking the index, so a nullable sort key (due_date) is
+    paged as two segments, the NULL block and the non-NULL range, each of
+    which is a plain index range.
+
+    The cursor carries the sort key exactly as SQLite stored it, so it is
+    bound as a plain string rather than re-rendered through the DateTime
+    type (server defaults store no microseconds, ORM writes do).
+    """
+    if not sort_column.expression.nullable:
+        segments = ["value"]
+    elif descending:
+        segments = ["value", "null"]
+    else:
+        segments = ["null", "value"]
+
+    if cursor_key is None:
+        start = 0
+    else:
+        value, last_id = cursor_key
+        start = segments.index("null" if value is None else "value")
+
+    clauses = []
+    for position, segment in enumerate(segments[start:]):
+        resume = cursor_key is not None and position == 0
+        if segment == "null":
+            clause = sort_column.is_(None)
+            if resume:
+                after_id = Task.id < last_id if descending else Task.id > last_id
+                clause = and_(clause, after_id)
+        elif resume:
+            key = tuple_(literal(value, String), last_id)
+            row = tuple_(sort_column, Task.id)
+            clause = row < key if descending else row > key
+        elif len(segments) > 1:
+            clause = sort_column.is_not(None)
+        else:
+            clause = None
+        clauses.append(clause)
+    return clauses
+
+
+def _owner_scope(stmt, current_user: Principal):
+    # Regular users only see their own tasks; admins can see all
+    if current_user.role != UserRole.admin:
+        stmt = stmt.where(Task.user_id == current_user.id)
+    return stmt
+
+
+async def _settle_pending_writes(current_user: Principal) -> None:
+    """Flush buffered PATCHes in the caller's scope before a set-based read.
+
+    Single-task reads overlay pending values instead; lists, aggregates and
+    the change feed need them in the database.
+    """
+    owner_id = None if current_user.role == UserRole.admin else current_user.id
+    if task_write_buffer.has_pending(owner_id=owner_id):
+        await task_write_buffer.flush()
+
+
+async def _collection_version(db: AsyncSession, current_user: Principal):
+    """Return (version, last_modified) of the task list the caller can see."""
+    stmt = select(TaskVersion.version, TaskVersion.updated_at)
+    if current_user.role == UserRole.admin:
+        stmt = stmt.order_by(TaskVersion.version.desc()).limit(1)
+    else:
+        stmt = stmt.where(TaskVersion.user_id == current_user.id)
+    row = (await db.execute(stmt)).first()
+    return (row.version, row.updated_at) if row else (0, None)
+
+
+def _filter_tasks(
+    stmt,
+    current_user: Principal,
+    status: Optional[TaskStatus],
+    priority: Optional[TaskPriority],
+):
+    stmt = _owner_scope(stmt, current_user)
+    if status:
+        stmt = stmt.where(Task.status == status)
+    if priority:
+        stmt = stmt.where(Task.priority == priority)
+    return stmt
+
 
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
@@ -24,14 +219,187 @@ async def create_task(
         user_id=current_user.id,
     )
     db.add(new_task)
+    # The INSERT already returns id, created_at and updated_at, so no
+    # refresh round trip is needed
     await db.commit()
-    await db.refresh(new_task)
+    get_response_cache().invalidate_owner(current_user.id)
     return new_task
 
 
-@router.get("/", response_model=List[TaskResponse])
+def _null_required_fields(values: dict) -> list[str]:
+    """Fields set to None that the tasks table declares NOT NULL."""
+    return [
+        key for key, value in values.items()
+        if value is None and not Task.__table__.c[key].nullable
+    ]
+
+
+async def _check_bulk_ownership(
+    db: AsyncSession, current_user: Principal, ids: List[int]
+) -> tuple[dict, set]:
+    """Classify requested ids with one query.
+
+    Returns per-index error results for ids that are duplicated, missing or
+    owned by someone else, plus the set of ids the caller may modify.
+    """
+    owners = {}
+    if ids:
+        result = await db.execute(
+            select(Task.id, Task.user_id).where(Task.id.in_(set(ids)))
+        )
+        owners = dict(result.all())
+
+    errors = {}
+    allowed = set()
+    for index, task_id in enumerate(ids):
+        if task_id not in owners:
+            errors[index] = TaskBulkResult(index=index, id=task_id, status="not_found")
+        elif current_user.role != UserRole.admin and owners[task_id] != current_user.id:
+            errors[index] = TaskBulkResult(index=index, id=task_id, status="forbidden")
+        elif task_id in allowed:
+            errors[index] = TaskBulkResult(index=index, id=task_id, status="duplicate")
+        else:
+            allowed.add(task_id)
+    return errors, allowed
+
+
+@router.post(
+    "/bulk",
+    response_model=TaskBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks_bulk(
+    current_user: CurrentUser,
+    tasks_in: List[TaskCreate] = Body(..., max_length=settings.bulk_max_items),
+    db: AsyncSession = Depends(get_db),
+):
+    rows = [
+        {**task_in.model_dump(), "user_id": current_user.id} for task_in in tasks_in
+    ]
+    created = []
+    if rows:
+        # SQLite does not promise RETURNING order for a multi-row INSERT, but
+        # rowids are handed out in VALUES order, so sorting by id restores it
+        result = await db.scalars(insert(Task).returning(Task), rows)
+        created = sorted(result.all(), key=lambda task: task.id)
+        await db.commit()
+        get_response_cache().invalidate_owner(current_user.id)
+
+    return TaskBulkResponse(
+        results=[
+            TaskBulkResult(index=index, id=task.id, status="created", task=task)
+            for index, task in enumerate(created)
+        ]
+    )
+
+
+@router.patch("/bulk", response_model=TaskBulkResponse)
+async def update_tasks_bulk(
+    current_user: CurrentUser,
+    updates: List[TaskBulkUpdate] = Body(..., max_length=settings.bulk_max_items),
+    db: AsyncSession = Depends(get_db),
+):
+    ids = [item.id for item in updates]
+    if task_write_buffer.has_pending(ids):
+        await task_write_buffer.flush()
+    errors, allowed = await _check_bulk_ownership(db, current_user, ids)
+
+    # One UPDATE for the whole batch: each changed column becomes
+    # CASE id WHEN ... THEN <new value> ... ELSE <column> END
+    changes = {}
+    changed_ids = set()
+    for index, item in enumerate(updates):
+        if index in errors:
+            continue
+        item_changes = item.model_dump(exclude_unset=True, exclude={"id"})
+        nulls = _null_required_fields(item_changes)
+        if nulls:
+            # A null here would fail the shared UPDATE for every item
+            errors[index] = TaskBulkResult(
+                index=index, id=item.id, status="invalid",
+                detail=f"May not be null: {', '.join(nulls)}",
+            )
+            allowed.discard(item.id)
+            continue
+        for key, value in item_changes.items():
+            changes.setdefault(key, []).append((item.id, value))
+        if item_changes:
+            changed_ids.add(item.id)
+
+    updated = {}
+    if changed_ids:
+        stmt = update(Task).where(Task.id.in_(changed_ids))
+        stmt = _owner_scope(stmt, current_user)
+        values = {}
+        for key, pairs in changes.items():
+            column = getattr(Task, key)
+            values[key] = case(
+                *((Task.id == task_id, literal(value, column.type)) for task_id, value in pairs),
+                else_=column,
+            )
+        stmt = stmt.values(**values)
+        stmt = stmt.returning(Task).execution_options(synchronize_session=False)
+        result = await db.scalars(stmt)
+        updated = {task.id: task for task in result.all()}
+        await db.commit()
+        for owner in {task.user_id for task in updated.values()}:
+            get_response_cache().invalidate_owner(owner)
+
+    unchanged_ids = allowed - changed_ids
+    if unchanged_ids:
+        # Items with no fields are reads, like an empty single PATCH
+        stmt = _owner_scope(select(Task).where(Task.id.in_(unchanged_ids)), current_user)
+        updated.update({task.id: task for task in (await db.scalars(stmt)).all()})
+
+    results = []
+    for index, item in enumerate(updates):
+        if index in errors:
+            results.append(errors[index])
+        elif item.id in updated:
+            results.append(
+                TaskBulkResult(index=index, id=item.id, status="updated", task=updated[item.id])
+            )
+        else:
+            # Deleted or reassigned between the ownership check and the UPDATE
+            results.append(TaskBulkResult(index=index, id=item.id, status="not_found"))
+    return TaskBulkResponse(results=results)
+
+
+@router.delete("/bulk", response_model=TaskBulkResponse)
+async def delete_tasks_bulk(
+    current_user: CurrentUser,
+    ids: List[int] = Body(..., max_length=settings.bulk_max_items),
+    db: AsyncSession = Depends(get_db),
+):
+    if task_write_buffer.has_pending(ids):
+        await task_write_buffer.flush()
+    errors, allowed = await _check_bulk_ownership(db, current_user, ids)
+
+    deleted = {}
+    if allowed:
+        stmt = delete(Task).where(Task.id.in_(allowed))
+        stmt = _owner_scope(stmt, current_user)
+        result = await db.execute(stmt.returning(Task.id, Task.user_id))
+        deleted = dict(result.all())
+        await db.commit()
+        for owner in set(deleted.values()):
+            get_response_cache().invalidate_owner(owner)
+
+    results = []
+    for index, task_id in enumerate(ids):
+        if index in errors:
+            results.append(errors[index])
+        elif task_id in deleted:
+            results.append(TaskBulkResult(index=index, id=task_id, status="deleted"))
+        else:
+            results.append(TaskBulkResult(index=index, id=task_id, status="not_found"))
+    return TaskBulkResponse(results=results)
+
+
+@router.get("/", response_model=Union[List[TaskResponse], TaskPage])
 async def get_tasks(
     current_user: CurrentUser,
+    request: Request,
     status: Optional[TaskStatus] = Query(None, description="Filter by status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
     sort_by: str = Query(
@@ -41,18 +409,106 @@ async def get_tasks(
     order: str = Query("desc", description="Sort order: 'asc' or 'desc'"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: AsyncSession = Depends(get_db),
+    pagination: str = Query(
+        "offset",
+        description="Pagination mode: 'offset' (page/page_size) or 'cursor'",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (cursor mode)"
+    ),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    stmt = select(Task)
+    await _settle_pending_writes(current_user)
 
-    # Regular users only see their own tasks; admins can see all
-    if current_user.role != UserRole.admin:
-        stmt = stmt.where(Task.user_id == current_user.id)
+    # The collection version changes on every write to the caller's tasks,
+    # so a matching If-None-Match answers 304 before the list query runs
+    version, last_modified = await _collection_version(db, current_user)
+    etag = make_etag(
+        "tasks",
+        "all" if current_user.role == UserRole.admin else current_user.id,
+        version,
+        sorted(request.query_params.multi_items()),
+    )
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+
+    # The ETag already covers scope, collection version and every query
+    # parameter, so it doubles as the cache key: a write anywhere in scope
+    # changes the version and no worker can serve a stale body
+    cache = get_response_cache()
+    body = cache.get(etag)
+    if body is None:
+        body = await _render_task_list(
+            db, current_user, status, priority, sort_by, order,
+            page, page_size, pagination, cursor,
+        )
+        scope = ALL_OWNERS if current_user.role == UserRole.admin else owner_tag(current_user.id)
+        cache.set(etag, body, (scope,))
+
+    response = Response(content=body, media_type="application/json")
+    set_validators(response, etag, last_modified)
+    return response
+
+
+# Columns in TaskRow (= TaskResponse) order. List pages select just these
+# as plain rows and serialize them in one pass through a precompiled
+# TypeAdapter, skipping ORM identity-map work and per-row model validation.
+TASK_ROW_FIELDS = tuple(TaskRow.__annotations__)
+TASK_ROW_COLUMNS = tuple(getattr(Task, name) for name in TASK_ROW_FIELDS)
+_TASK_ROWS_ADAPTER = TypeAdapter(List[TaskRow])
+_TASK_ROW_PAGE_ADAPTER = TypeAdapter(TaskRowPage)
 
-    if status:
-        stmt = stmt.where(Task.status == status)
-    if priority:
-        stmt = stmt.where(Task.priority == priority)
+
+def _task_rows(rows) -> list:
+    return [dict(zip(TASK_ROW_FIELDS, row)) for row in rows]
+
+
+async def _render_task_list(
+    db: AsyncSession,
+    current_user: Principal,
+    status: Optional[TaskStatus],
+    priority: Optional[TaskPriority],
+    sort_by: str,
+    order: str,
+    page: int,
+    page_size: int,
+    pagination: str,
+    cursor: Optional[str],
+) -> bytes:
+    stmt = _filter_tasks(select(*TASK_ROW_COLUMNS), current_user, status, priority)
+
+    if pagination == "cursor" or cursor is not None:
+        if sort_by not in CURSOR_SORT_COLUMNS:
+            sort_by = "created_at"
+        order = "desc" if order.lower() == "desc" else "asc"
+        descending = order == "desc"
+        sort_column = CURSOR_SORT_COLUMNS[sort_by]
+        direction = desc if descending else asc
+
+        cursor_key = None
+        if cursor is not None:
+            cursor_key = _decode_cursor(cursor, sort_by, order)
+
+        stmt = stmt.add_columns(type_coerce(sort_column, String).label("sort_key"))
+        stmt = stmt.order_by(direction(sort_column), direction(Task.id))
+
+        # Fetch one extra row to learn whether another page exists
+        rows = []
+        for clause in _keyset_segments(sort_column, descending, cursor_key):
+            segment_stmt = stmt if clause is None else stmt.where(clause)
+            result = await db.execute(segment_stmt.limit(page_size + 1 - len(rows)))
+            rows.extend(result.all())
+            if len(rows) > page_size:
+                break
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            next_cursor = _encode_cursor(sort_by, order, last.sort_key, last.id)
+        return _TASK_ROW_PAGE_ADAPTER.dump_json(
+            {"items": _task_rows(rows), "next_cursor": next_cursor}
+        )
 
     sort_column = getattr(Task, sort_by, Task.created_at)
     if order.lower() == "desc":
@@ -64,15 +520,191 @@ async def get_tasks(
     stmt = stmt.offset(offset).limit(page_size)
 
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return _TASK_ROWS_ADAPTER.dump_json(_task_rows(result.all()))
 
 
-@router.get("/{task_id}", response_model=TaskResponse)
-async def get_task(
-    task_id: int,
+EXPORT_COLUMNS = (
+    "id",
+    "user_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "created_at",
+    "updated_at",
+)
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_CHUNK_ROWS = 500
+
+
+def _export_value(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def _export_rows(stmt, format: str, user_id: int):
+    """Stream rows through a server-side cursor, yielding encoded chunks.
+
+    The export opens its own session because the response body is produced
+    after the request's dependencies may already have been torn down.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if format == "csv":
+        writer.writerow(EXPORT_COLUMNS)
+
+    async with read_session(user_id) as session:
+        result = await session.stream(stmt.execution_options(yield_per=EXPORT_CHUNK_ROWS))
+        async for partition in result.partitions():
+            for row in partition:
+                values = [_export_value(value) for value in row]
+                if format == "csv":
+                    writer.writerow(values)
+                else:
+                    buffer.write(json.dumps(dict(zip(EXPORT_COLUMNS, values))))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get("/export")
+async def export_tasks(
     current_user: CurrentUser,
+    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
+    format: str = Query(
+        "ndjson",
+        pattern="^(ndjson|csv)$",
+        description="Export format: 'ndjson' or 'csv'",
+    ),
+):
+    await _settle_pending_writes(current_user)
+    columns = [getattr(Task, name) for name in EXPORT_COLUMNS]
+    stmt = _filter_tasks(select(*columns), current_user, status, priority)
+    stmt = stmt.order_by(Task.id)
+
+    return StreamingResponse(
+        _export_rows(stmt, format, current_user.id),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks.{format}"'
+        },
+    )
+
+
+@router.get("/stats", response_model=TaskStats)
+async def get_task_stats(
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_read_db),
+):
+    await _settle_pending_writes(current_user)
+    now = datetime.utcnow()
+    in_24h = now + timedelta(hours=24)
+    in_7d = now + timedelta(days=7)
+
+    if settings.task_stats_use_summary:
+        counts_stmt = select(
+            TaskCount.status, TaskCount.priority, func.sum(TaskCount.task_count)
+        ).where(TaskCount.task_count > 0)
+        if current_user.role != UserRole.admin:
+            counts_stmt = counts_stmt.where(TaskCount.user_id == current_user.id)
+        counts_stmt = counts_stmt.group_by(TaskCount.status, TaskCount.priority)
+    else:
+        counts_stmt = _owner_scope(
+            select(Task.status, Task.priority, func.count()), current_user
+        ).group_by(Task.status, Task.priority)
+
+    def bucket(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+    # Every bucket is an open task due within the next 7 days (or already
+    # overdue), so the range on due_date bounds the rows read
+    due_stmt = _owner_scope(
+        select(
+            bucket(Task.due_date < now),
+            bucket(Task.due_date.between(now, in_24h)),
+            bucket(Task.due_date >= now),
+        ).where(Task.status != TaskStatus.done, Task.due_date < in_7d),
+        current_user,
+    )
+
+    counts = [
+        TaskStatusPriorityCount(status=row[0], priority=row[1], count=row[2])
+        for row in (await db.execute(counts_stmt)).all()
+    ]
+    overdue, due_within_24h, due_within_7d = (await db.execute(due_stmt)).one()
+
+    return TaskStats(
+        total=sum(item.count for item in counts),
+        counts=counts,
+        overdue=overdue,
+        due_within_24h=due_within_24h,
+        due_within_7d=due_within_7d,
+        generated_at=now,
+    )
+
+
+def _fts_match_query(q: str) -> str:
+    """Turn free text into an FTS5 query that cannot be a syntax error.
+
+    Each word is quoted as a literal term (terms are ANDed); a trailing
+    ``*`` on a word is kept as a prefix match.
+    """
+    terms = []
+    for word in q.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*")
+        if word:
+            terms.append('"' + word.replace('"', '""') + '"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+@router.get("/search", response_model=List[TaskSearchHit])
+async def search_tasks(
+    current_user: CurrentUser,
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     db: AsyncSession = Depends(get_db),
 ):
+    match = _fts_match_query(q)
+    if not match:
+        return []
+    await _settle_pending_writes(current_user)
+
+    fts = literal_column("tasks_fts")
+    # Title matches weigh ten times more than description matches
+    rank = func.bm25(fts, 10.0, 1.0).label("search_rank")
+    snippet = func.snippet(fts, -1, "<mark>", "</mark>", "…", 12).label("snippet")
+
+    stmt = (
+        select(Task, rank, snippet)
+        .join(tasks_fts, tasks_fts.c.rowid == Task.id)
+        .where(fts.op("MATCH")(match))
+    )
+    stmt = _filter_tasks(stmt, current_user, status, priority)
+    stmt = stmt.order_by(rank).offset((page - 1) * page_size).limit(page_size)
+
+    result = await db.execute(stmt)
+    return [
+        TaskSearchHit(task=task, rank=task_rank, snippet=task_snippet)
+        for task, task_rank, task_snippet in result.all()
+    ]
+
+
+async def _get_task_or_raise(
+    db: AsyncSession, task_id: int, current_user: Principal, action: str = "access"
+) -> Task:
     result = await db.execute(select(Task).where(Task.id == task_id))
     task = result.scalar_one_or_none()
 
@@ -84,101 +716,419 @@ async def get_task(
     if current_user.role != UserRole.admin and task.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this task",
+            detail=f"Not authorized to {action} this task",
         )
 
+    # Show updates still sitting in the write-behind buffer
+    pending = task_write_buffer.pending_values(task_id)
+    if pending:
+        for key, value in pending.items():
+            set_committed_value(task, key, value)
+
     return task
 
 
-@router.patch("/{task_id}", response_model=TaskResponse)
-async def update_task(
-    task_id: int,
-    task_update: TaskUpdate,
+async def _read_changes(
+    db: AsyncSession, current_user: Principal, since: int, limit: int
+) -> TaskChangeFeed:
+    """Read the change log after ``since``, keeping the last change per task."""
+    stmt = (
+        select(TaskChange, Task)
+        .outerjoin(Task, Task.id == TaskChange.task_id)
+        .where(TaskChange.seq > since)
+    )
+    if current_user.role != UserRole.admin:
+        stmt = stmt.where(TaskChange.user_id == current_user.id)
+    stmt = stmt.order_by(TaskChange.seq).limit(limit + 1)
+
+    rows = (await db.execute(stmt)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    latest = {}
+    for change, task in rows:
+        visible = task is not None and (
+            current_user.role == UserRole.admin or task.user_id == current_user.id
+        )
+        # A task that is gone, or no longer the caller's, reads as deleted
+        # even if this entry was an upsert
+        if change.op == "upsert" and visible:
+            event = TaskChangeEvent(seq=change.seq, op="upsert", task_id=change.task_id, task=task)
+        else:
+            event = TaskChangeEvent(seq=change.seq, op="delete", task_id=change.task_id)
+        latest.pop(change.task_id, None)
+        latest[change.task_id] = event
+
+    return TaskChangeFeed(
+        changes=list(latest.values()),
+        next_since=rows[-1][0].seq if rows else since,
+        has_more=has_more,
+    )
+
+
+async def _check_since_retained(db: AsyncSession, since: int) -> None:
+    """410 when entries after ``since`` have already been pruned."""
+    pruned = await pruned_through(db)
+    if since < pruned:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=f"Changes up to seq {pruned} have been pruned; reload the tasks and resume from it",
+            headers={"X-Change-Feed-Pruned-Through": str(pruned)},
+        )
+
+
+@router.get("/changes", response_model=TaskChangeFeed)
+async def get_task_changes(
     current_user: CurrentUser,
+    since: int = Query(0, ge=0, description="Last seq already seen"),
+    limit: int = Query(100, ge=1, le=1000, description="Max change entries to read"),
+    wait: float = Query(
+        0,
+        ge=0,
+        le=settings.change_feed_max_wait_seconds,
+        description="Long-poll: seconds to wait for a change if none are pending",
+    ),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
+    await _settle_pending_writes(current_user)
+    await _check_since_retained(db, since)
+    deadline = time.monotonic() + wait
+    while True:
+        feed = await _read_changes(db, current_user, since, limit)
+        remaining = deadline - time.monotonic()
+        if feed.next_since != since or remaining <= 0:
+            return feed
 
-    if task is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+        # Hold no connection while parked
+        await db.close()
+        await change_notifier.wait(
+            min(remaining, settings.change_feed_poll_interval_seconds)
         )
 
-    if current_user.role != UserRole.admin and task.user_id != current_user.id:
+
+async def _change_events(request: Request, current_user: Principal, since: int):
+    last_sent = time.monotonic()
+    while not await request.is_disconnected():
+        async with AsyncSessionLocal() as session:
+            feed = await _read_changes(session, current_user, since, 100)
+
+        for event in feed.changes:
+            payload = event.model_dump_json()
+            yield f"id: {event.seq}\nevent: {event.op}\ndata: {payload}\n\n"
+            last_sent = time.monotonic()
+        since = feed.next_since
+        if feed.has_more:
+            continue
+
+        if time.monotonic() - last_sent >= settings.change_feed_heartbeat_seconds:
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
+        await change_notifier.wait(settings.change_feed_poll_interval_seconds)
+
+
+@router.get("/changes/stream")
+async def stream_task_changes(
+    current_user: CurrentUser,
+    request: Request,
+    since: int = Query(0, ge=0, description="Last seq already seen"),
+):
+    # Reconnecting EventSource clients resume from the last delivered id
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    async with AsyncSessionLocal() as session:
+        await _check_since_retained(session, since)
+
+    return StreamingResponse(
+        _change_events(request, current_user, since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _fetch_task_batch(
+    db: AsyncSession, current_user: Principal, ids: List[int]
+) -> TaskBatchResponse:
+    """Fetch tasks by id in one owner-scoped query, in request order.
+
+    Ids the scoped query did not return are classified with a second,
+    id-only query, so the common all-visible case costs one statement.
+    """
+    if len(ids) > settings.task_batch_max_ids:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to modify this task",
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"At most {settings.task_batch_max_ids} ids per request",
         )
 
-    update_data = task_update.model_dump(exclude_unset=True)
+    rows = {}
+    if ids:
+        stmt = _owner_scope(select(*TASK_ROW_COLUMNS).where(Task.id.in_(set(ids))), current_user)
+        rows = {row["id"]: row for row in _task_rows((await db.execute(stmt)).all())}
 
-    for key, value in update_data.items():
-        setattr(task, key, value)
+    missing = set(ids) - rows.keys()
+    existing = set()
+    if missing and current_user.role != UserRole.admin:
+        result = await db.execute(select(Task.id).where(Task.id.in_(missing)))
+        existing = set(result.scalars().all())
 
-    await db.commit()
-    await db.refresh(task)
-    return task
+    results = []
+    for index, task_id in enumerate(ids):
+        row = rows.get(task_id)
+        if row is not None:
+            # Show updates still sitting in the write-behind buffer
+            pending = task_write_buffer.pending_values(task_id)
+            task = {**row, **pending} if pending else row
+            results.append(TaskBatchResult(index=index, id=task_id, status="found", task=task))
+        elif task_id in existing:
+            results.append(TaskBatchResult(index=index, id=task_id, status="forbidden"))
+        else:
+            results.append(TaskBatchResult(index=index, id=task_id, status="not_found"))
+    return TaskBatchResponse(results=results)
 
 
-@router.put("/{task_id}", response_model=TaskResponse)
-async def replace_task(
+@router.get("/batch", response_model=TaskBatchResponse)
+async def get_tasks_batch(
+    current_user: CurrentUser,
+    ids: str = Query(
+        ...,
+        pattern=r"^\d+(,\d+)*$",
+        description="Comma-separated task ids, e.g. 3,1,2",
+    ),
+    db: AsyncSession = Depends(get_read_db),
+):
+    return await _fetch_task_batch(db, current_user, [int(part) for part in ids.split(",")])
+
+
+@router.post("/batch", response_model=TaskBatchResponse)
+async def post_tasks_batch(
+    current_user: CurrentUser,
+    ids: List[int] = Body(..., max_length=settings.task_batch_max_ids),
+    db: AsyncSession = Depends(get_read_db),
+):
+    # POST for id lists too long for a URL; still a read
+    return await _fetch_task_batch(db, current_user, ids)
+
+
+@router.get("/{task_id}", response_model=TaskResponse)
+async def get_task(
     task_id: int,
-    task_in: TaskCreate,
     current_user: CurrentUser,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
 ):
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
+    task = await _get_task_or_raise(db, task_id, current_user)
 
-    if task is None:
+    # updated_at only has one-second resolution, so the ETag hashes the
+    # stored values themselves; no serialization happens on a 304
+    etag = make_etag("task", *(getattr(task, name) for name in EXPORT_COLUMNS))
+    if is_not_modified(request, etag, task.updated_at):
+        return not_modified(etag, task.updated_at)
+    set_validators(response, etag, task.updated_at)
+
+    return task
+
+
+async def _raise_missing_or_forbidden(db: AsyncSession, task_id: int, action: str):
+    """Explain why an owner-scoped write matched no row.
+
+    Only runs on the failure path, so successful writes stay at one
+    statement while keeping the 404/403 distinction.
+    """
+    result = await db.execute(select(Task.id).where(Task.id == task_id))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
         )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"Not authorized to {action} this task",
+    )
 
-    if current_user.role != UserRole.admin and task.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to modify this task",
-        )
 
-    update_data = task_in.model_dump()
+async def _update_owned_task(
+    db: AsyncSession, task_id: int, current_user: Principal, values: dict
+) -> Task:
+    if not values:
+        # Nothing to write; behave like a read of the task
+        return await _get_task_or_raise(db, task_id, current_user)
 
-    for key, value in update_data.items():
-        setattr(task, key, value)
+    if task_write_buffer.has_pending((task_id,)):
+        await task_write_buffer.flush()
+    stmt = _owner_scope(update(Task).where(Task.id == task_id), current_user)
+    stmt = stmt.values(**values).returning(Task)
+    stmt = stmt.execution_options(synchronize_session=False)
+    task = (await db.scalars(stmt)).one_or_none()
+
+    if task is None:
+        await _raise_missing_or_forbidden(db, task_id, "modify")
 
     await db.commit()
-    await db.refresh(task)
+    get_response_cache().invalidate_owner(task.user_id)
     return task
 
 
+@router.patch("/{task_id}", response_model=TaskResponse)
+async def update_task(
+    task_id: int,
+    task_update: TaskUpdate,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+):
+    update_data = task_update.model_dump(exclude_unset=True)
+    if settings.task_write_behind and update_data:
+        # The buffered write happens after the response, so reject what a
+        # direct UPDATE would: nulls in NOT NULL columns
+        nulls = _null_required_fields(update_data)
+        if nulls:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=f"May not be null: {', '.join(nulls)}",
+            )
+        # Acknowledge after the ownership check; the flusher writes the
+        # merged values later and bumps updated_at then
+        task = await _get_task_or_raise(db, task_id, current_user, "modify")
+        task_write_buffer.enqueue(task_id, task.user_id, update_data)
+        for key, value in update_data.items():
+            set_committed_value(task, key, value)
+        set_committed_value(task, "updated_at", datetime.utcnow().replace(microsecond=0))
+        return task
+    return await _update_owned_task(db, task_id, current_user, update_data)
+
+
+@router.put("/{task_id}", response_model=TaskResponse)
+async def replace_task(
+    task_id: int,
+    task_in: TaskCreate,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+):
+    return await _update_owned_task(db, task_id, current_user, task_in.model_dump())
+
+
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
     task_id: int,
     current_user: CurrentUser,
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
+    if task_write_buffer.has_pending((task_id,)):
+        await task_write_buffer.flush()
+    stmt = _owner_scope(delete(Task).where(Task.id == task_id), current_user)
+    result = await db.execute(stmt.returning(Task.user_id))
+    deleted = result.one_or_none()
 
-    if task is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+    if deleted is None:
+        await _raise_missing_or_forbidden(db, task_id, "delete")
+
+    await db.commit()
+    get_response_cache().invalidate_owner(deleted.user_id)
+
+
+async def _delete_tasks_in_chunks(job: Job, first_id: int, last_id: int) -> None:
+    """Delete tasks with ids in [first_id, last_id], one batch at a time.
+
+    Each batch is the next ``purge_batch_size`` remaining ids, deleted in
+    its own short transaction with a pause in between so other writers can
+    take the lock. Gaps in the id range cost nothing, and the loop ends as
+    soon as a batch comes up short. Tasks created after the job started
+    have larger ids and are left alone.
+    """
+    batch_size = settings.purge_batch_size
+    batch = (
+        select(Task.id)
+        .where(Task.id >= first_id, Task.id <= last_id)
+        .order_by(Task.id)
+        .limit(batch_size)
+    )
+    while True:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(delete(Task).where(Task.id.in_(batch)))
+            await session.commit()
+        job.processed += result.rowcount
+        if result.rowcount:
+            get_response_cache().clear()
+        if result.rowcount < batch_size:
+            break
+        await asyncio.sleep(settings.purge_pause_seconds)
+
+
+async def _truncate_tasks(db: AsyncSession) -> None:
+    """Empty tasks in one transaction without per-row trigger work.
+
+    SQLite only applies its truncate optimization to a table with no
+    triggers, so the triggers are dropped and recreated around the DELETE.
+    The derived tables they maintain are reset in bulk instead. The change
+    log gets one tombstone per task, so feed readers still see every
+    delete, and every collection version is bumped so ETags change.
+
+    pysqlite only opens a transaction before DML, so the DROP TRIGGERs
+    would otherwise each commit on their own. Driver autobegin is switched
+    off and an explicit BEGIN IMMEDIATE takes the write lock first: the
+    whole swap commits or rolls back as one, and no other connection can
+    write while the triggers are gone.
+    """
+    conn = await db.connection()
+    await conn.run_sync(_set_driver_autobegin, False)
+    try:
+        await db.execute(text("BEGIN IMMEDIATE"))
+        await _swap_out_tasks(db)
+    except BaseException:
+        await conn.run_sync(_set_driver_autobegin, True)
+        await db.rollback()
+        raise
+    await conn.run_sync(_set_driver_autobegin, True)
+    await db.commit()
+
+
+def _set_driver_autobegin(sync_conn, enabled: bool) -> None:
+    # isolation_level None stops pysqlite from emitting BEGIN itself;
+    # switching back inside an open transaction leaves it open
+    sync_conn.connection.dbapi_connection.isolation_level = "" if enabled else None
+
+
+async def _swap_out_tasks(db: AsyncSession) -> None:
+    triggers = (
+        await db.execute(
+            text("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'tasks'")
         )
+    ).all()
+    for name, _ in triggers:
+        await db.execute(text(f'DROP TRIGGER "{name}"'))
 
-    if current_user.role != UserRole.admin and task.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this task",
+    await db.execute(
+        text(
+            "INSERT INTO task_changes (task_id, user_id, op, changed_at) "
+            "SELECT id, COALESCE(user_id, 0), 'delete', CURRENT_TIMESTAMP FROM tasks"
+        )
+    )
+    await db.execute(
+        text(
+            "UPDATE task_versions SET "
+            "version = (SELECT MAX(version) + 1 FROM task_versions), "
+            "updated_at = CURRENT_TIMESTAMP"
         )
+    )
+    await db.execute(delete(TaskCount))
+    await db.execute(text("INSERT INTO tasks_fts (tasks_fts) VALUES ('delete-all')"))
+    await db.execute(delete(Task))
 
-    await db.delete(task)
-    await db.commit()
+    for _, ddl in triggers:
+        await db.execute(text(ddl))
 
 
-@router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=JobResponse,
+    responses={status.HTTP_204_NO_CONTENT: {"description": "Truncated"}},
+)
 async def delete_all_tasks(
     current_user: CurrentUser,
+    truncate: bool = Query(
+        False,
+        description="Empty the table in one fast transaction instead of a background job",
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     if current_user.role != UserRole.admin:
@@ -187,5 +1137,25 @@ async def delete_all_tasks(
             detail="Only admins can delete all tasks",
         )
 
-    await db.execute(delete(Task))
-    await db.commit()
+    # Buffered PATCHes would otherwise land on deleted rows (a no-op) or
+    # race the chunked delete
+    await task_write_buffer.flush()
+
+    if truncate:
+        await _truncate_tasks(db)
+        get_response_cache().clear()
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    job = job_registry.running("delete_all_tasks")
+    if job is not None:
+        return job
+
+    first_id, last_id = (await db.execute(select(func.min(Task.id), func.max(Task.id)))).one()
+    total = await db.scalar(select(func.coalesce(func.sum(TaskCount.task_count), 0)))
+    await db.close()
+
+    async def purge(job: Job) -> None:
+        if first_id is not None:
+            await _delete_tasks_in_chunks(job, first_id, last_id)
+
+    return job_registry.start("delete_all_tasks", purge, total=total)
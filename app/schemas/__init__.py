@@ -1,9 +1,30 @@
-from app.schemas.task import TaskBase, TaskCreate, TaskUpdate, TaskResponse
+from app.schemas.task import (
+    TaskBase,
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskPage,
+    TaskRow,
+    TaskRowPage,
+    TaskBulkUpdate,
+    TaskBulkResult,
+    TaskBulkResponse,
+    TaskBatchResult,
+    TaskBatchResponse,
+    TaskStatusPriorityCount,
+    TaskStats,
+    TaskSearchHit,
+    TaskChangeEvent,
+    TaskChangeFeed,
+)
 from app.schemas.user import (
     UserBase,
     UserCreate,
     UserLogin,
     UserResponse,
+    UserListItem,
+    UserPage,
     Token,
     TokenRefreshRequest,
-)
\ No newline at end of file
+)
+from app.schemas.job import JobResponse
\ No newline at end of file
@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict
+
+
+class JobResponse(BaseModel):
+    id: str
+    kind: str
+    status: Literal["pending", "running", "done", "failed", "cancelled"]
+    total: Optional[int] = None
+    processed: int
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,6 +1,8 @@
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
+
+from typing_extensions import TypedDict
 
 from app.models.task import TaskStatus, TaskPriority
 
@@ -27,4 +29,83 @@ class TaskResponse(TaskBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class TaskRow(TypedDict):
+    """TaskResponse as a plain dict, in the same field order.
+
+    Lets list endpoints serialize selected column rows in one pass without
+    building a model per row.
+    """
+    title: str
+    description: Optional[str]
+    status: TaskStatus
+    priority: TaskPriority
+    due_date: Optional[datetime]
+    id: int
+    user_id: Optional[int]
+    created_at: datetime
+    updated_at: datetime
+
+class TaskRowPage(TypedDict):
+    items: List[TaskRow]
+    next_cursor: Optional[str]
+
+class TaskPage(BaseModel):
+    items: List[TaskResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page; null on the last page"
+    )
+
+class TaskBulkUpdate(TaskUpdate):
+    id: int
+
+class TaskBulkResult(BaseModel):
+    index: int = Field(..., description="Position of the item in the request body")
+    id: Optional[int] = None
+    status: Literal[
+        "created", "updated", "deleted", "not_found", "forbidden", "duplicate", "invalid"
+    ]
+    task: Optional[TaskResponse] = None
+    detail: Optional[str] = None
+
+class TaskBulkResponse(BaseModel):
+    results: List[TaskBulkResult]
+
+class TaskBatchResult(BaseModel):
+    index: int = Field(..., description="Position of the id in the request")
+    id: int
+    status: Literal["found", "not_found", "forbidden"]
+    task: Optional[TaskResponse] = None
+
+class TaskBatchResponse(BaseModel):
+    results: List[TaskBatchResult]
+
+class TaskStatusPriorityCount(BaseModel):
+    status: TaskStatus
+    priority: TaskPriority
+    count: int
+
+class TaskStats(BaseModel):
+    total: int
+    counts: List[TaskStatusPriorityCount]
+    overdue: int = Field(..., description="Not done and due_date in the past")
+    due_within_24h: int = Field(..., description="Not done and due in the next 24 hours")
+    due_within_7d: int = Field(..., description="Not done and due in the next 7 days")
+    generated_at: datetime
+
+class TaskSearchHit(BaseModel):
+    task: TaskResponse
+    rank: float = Field(..., description="BM25 score; lower is more relevant")
+    snippet: str = Field(..., description="Matching excerpt with <mark> highlights")
+
+class TaskChangeEvent(BaseModel):
+    seq: int
+    op: Literal["upsert", "delete"]
+    task_id: int
+    task: Optional[TaskResponse] = Field(None, description="Current state; null for deletes")
+
+class TaskChangeFeed(BaseModel):
+    changes: List[TaskChangeEvent]
+    next_since: int = Field(..., description="Pass as since to continue the feed")
+    has_more: bool
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
 from app.models.user import UserRole
 
@@ -36,6 +36,17 @@ class UserResponse(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserListItem(UserResponse):
+    task_count: int = Field(0, description="Tasks owned by the user")
+
+
+class UserPage(BaseModel):
+    items: List[UserListItem]
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as `cursor` to fetch the next page; null on the last page"
+    )
+
+
 class Token(BaseModel):
     access_token: str
     refresh_token: str
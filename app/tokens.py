@@ -0,0 +1,193 @@
+"""JWT signing keys, the verified-token cache and refresh-token revocation."""
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+from jose import JWTError, jwt
+from sqlalchemy import String, delete, select, type_coerce
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.revoked_token import RevokedToken
+
+
+def _signing_key(kid: str | None) -> str:
+    """Secret for ``kid``; tokens without a kid use ``jwt_secret_key``."""
+    if kid is None:
+        return settings.jwt_secret_key
+    try:
+        return settings.jwt_signing_keys[kid]
+    except KeyError:
+        raise JWTError(f"Unknown signing key {kid!r}")
+
+
+def encode_token(claims: dict) -> str:
+    """Sign ``claims`` with the active key, naming it in the ``kid`` header."""
+    kid = settings.jwt_active_kid
+    return jwt.encode(
+        claims,
+        _signing_key(kid),
+        algorithm=settings.jwt_algorithm,
+        headers={"kid": kid} if kid is not None else None,
+    )
+
+
+class TokenCache:
+    """LRU of verified token claims keyed by a hash of the token.
+
+    Entries are dropped once the token's ``exp`` passes, so a cached token
+    is never accepted for longer than it would be by a full verification.
+    Like the principal cache it is only touched from the event loop.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, claims = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return claims
+
+    def put(self, key: bytes, claims: dict) -> None:
+        exp = claims.get("exp")
+        if self.max_size <= 0 or not isinstance(exp, (int, float)):
+            return
+        self._entries[key] = (exp, claims)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+token_cache = TokenCache(max_size=settings.token_cache_max_size)
+
+
+def decode_token(token: str) -> dict:
+    """Verify ``token`` and return its claims, raising JWTError if invalid.
+
+    A token seen before is answered from the cache without re-checking the
+    signature. Callers must not modify the returned claims.
+    """
+    key = TokenCache.key(token)
+    claims = token_cache.get(key)
+    if claims is None:
+        kid = jwt.get_unverified_header(token).get("kid")
+        claims = jwt.decode(token, _signing_key(kid), algorithms=[settings.jwt_algorithm])
+        token_cache.put(key, claims)
+    return claims
+
+
+def new_token_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _compact(jti: str) -> bytes | str:
+    try:
+        return bytes.fromhex(jti)
+    except ValueError:
+        return jti
+
+
+class RevocationList:
+    """Revoked refresh-token ids, held in memory as 16-byte values.
+
+    The revoked_tokens table is the source of truth. The set is loaded in
+    full the first time it is used, then topped up with rows revoked since
+    the last sync (by any worker) at most every ``reload_seconds``. Each
+    sync also forgets ids whose token has expired, since those can no
+    longer be presented anyway.
+    """
+
+    def __init__(self, reload_seconds: float):
+        self.reload_seconds = reload_seconds
+        # compact jti -> token expiry
+        self._revoked: dict[bytes | str, datetime] = {}
+        self._synced_at: float | None = None
+        self._revoked_since: datetime | None = None
+
+    def is_revoked(self, jti: str) -> bool:
+        return _compact(jti) in self._revoked
+
+    async def sync(self, db: AsyncSession, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and self._synced_at is not None and now - self._synced_at < self.reload_seconds:
+            return
+
+        utcnow = datetime.utcnow()
+        self._revoked = {key: exp for key, exp in self._revoked.items() if exp >= utcnow}
+
+        stmt = select(RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at)
+        if self._revoked_since is None:
+            # Full load: expired tokens can no longer be used, so drop them
+            await db.execute(delete(RevokedToken).where(RevokedToken.expires_at < utcnow))
+            await db.commit()
+        else:
+            # revoked_at has second precision, so re-read the boundary second;
+            # compared as stored text (see the cursor notes in routers/task.py)
+            stmt = stmt.where(
+                type_coerce(RevokedToken.revoked_at, String)
+                >= self._revoked_since.isoformat(sep=" ")
+            )
+        for jti, expires_at, revoked_at in (await db.execute(stmt)).all():
+            self._revoked[_compact(jti)] = expires_at
+            if self._revoked_since is None or revoked_at > self._revoked_since:
+                self._revoked_since = revoked_at
+        if self._revoked_since is None:
+            self._revoked_since = datetime.min
+        self._synced_at = now
+
+    async def revoke(self, db: AsyncSession, jti: str, expires_at: datetime) -> bool:
+        """Record ``jti`` as revoked; the caller commits.
+
+        Returns False if it was already revoked, by this or any other
+        worker. The primary key makes this the check-and-set, so two
+        concurrent rotations of one refresh token cannot both win.
+        """
+        result = await db.execute(
+            sqlite_insert(RevokedToken)
+            .values(jti=jti, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+            .returning(RevokedToken.jti)
+        )
+        inserted = result.first() is not None
+        self._revoked[_compact(jti)] = expires_at
+        return inserted
+
+    def stats(self) -> dict:
+        return {"size": len(self._revoked)}
+
+
+revocation_list = RevocationList(reload_seconds=settings.revocation_reload_seconds)
@@ -0,0 +1,189 @@
+"""Write-behind buffer for PATCH /tasks/{task_id} (opt-in).
+
+Accepted updates are merged per task in memory (last write wins per field)
+and written in one transaction per flush, either every
+``task_write_behind_interval_seconds`` or as soon as
+``task_write_behind_max_batch`` tasks are pending. Reads overlay pending
+values, and any other write path flushes first, so callers never observe
+an update going backwards. The lifespan flushes on shutdown; updates still
+buffered when a worker is killed are lost.
+
+Updates are validated before they are accepted, but a batch can still
+fail (a constraint added later, a deleted owner). The batch is then
+retried one task per transaction: updates the database rejects are logged
+and dropped, so one bad entry cannot hold up everyone else's, and only
+transient errors (a locked database) put entries back for the next flush.
+"""
+import asyncio
+import logging
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+from app.config import settings
+from app.database import AsyncSessionLocal, primary_pins
+from app.models.task import Task
+from app.response_cache import get_response_cache
+
+logger = logging.getLogger(__name__)
+
+
+class TaskWriteBuffer:
+    def __init__(self, interval_seconds: float, max_batch: int):
+        self.interval_seconds = interval_seconds
+        self.max_batch = max_batch
+        # task id -> (owner id, merged field values)
+        self._pending: dict[int, tuple[int | None, dict]] = {}
+        # The batch being written; still overlaid on reads until committed
+        self._flushing: dict[int, tuple[int | None, dict]] = {}
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.flushes = 0
+        self.merged = 0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception(
+                "Write-behind flush failed on shutdown; %d task update(s) lost",
+                len(self._pending),
+            )
+
+    def enqueue(self, task_id: int, owner_id: int | None, values: dict) -> None:
+        entry = self._pending.get(task_id)
+        if entry is None:
+            self._pending[task_id] = (owner_id, dict(values))
+        else:
+            entry[1].update(values)
+            self.merged += 1
+        self.start()
+        if len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+
+    def discard_owner(self, owner_id: int) -> None:
+        """Forget buffered updates to ``owner_id``'s tasks (owner deleted)."""
+        for task_id in [t for t, (owner, _) in self._pending.items() if owner == owner_id]:
+            del self._pending[task_id]
+
+    def pending_values(self, task_id: int) -> dict | None:
+        """Values accepted for ``task_id`` but not yet committed, if any."""
+        flushing = self._flushing.get(task_id)
+        pending = self._pending.get(task_id)
+        if flushing is None and pending is None:
+            return None
+        values = dict(flushing[1]) if flushing else {}
+        if pending:
+            values.update(pending[1])
+        return values
+
+    def has_pending(self, task_ids=None, owner_id: int | None = None) -> bool:
+        """Whether anything is buffered, optionally for some tasks or one owner."""
+        entries = {**self._flushing, **self._pending}
+        if task_ids is not None:
+            return any(task_id in entries for task_id in task_ids)
+        if owner_id is not None:
+            return any(owner == owner_id for owner, _ in entries.values())
+        return bool(entries)
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._pending:
+                return
+            self._flushing, self._pending = self._pending, {}
+            try:
+                try:
+                    await self._write(self._flushing)
+                except DBAPIError:
+                    logger.warning(
+                        "Write-behind batch of %d failed; retrying per task",
+                        len(self._flushing),
+                        exc_info=True,
+                    )
+                    await self._write_each(self._flushing)
+            except Exception:
+                # Transient failure: put the batch back under anything
+                # accepted since
+                for task_id, (owner_id, values) in self._flushing.items():
+                    newer = self._pending.get(task_id)
+                    if newer is not None:
+                        values.update(newer[1])
+                    self._pending[task_id] = (owner_id, values)
+                raise
+            finally:
+                flushed, self._flushing = self._flushing, {}
+
+            self.flushes += 1
+            cache = get_response_cache()
+            for owner_id in {owner for owner, _ in flushed.values()}:
+                cache.invalidate_owner(owner_id)
+                primary_pins.pin(owner_id)
+
+    @staticmethod
+    def _statements(batch: dict):
+        """One executemany per distinct set of changed columns.
+
+        Plain UPDATE ... WHERE id = ?: a task deleted since it was buffered
+        simply matches no row. updated_at is bumped by the column's onupdate.
+        """
+        tasks = Task.__table__
+        groups: dict[tuple, list] = {}
+        for task_id, (_, values) in batch.items():
+            groups.setdefault(tuple(sorted(values)), []).append({"task_id": task_id, **values})
+        for keys, params in groups.items():
+            stmt = update(tasks).where(tasks.c.id == bindparam("task_id"))
+            yield stmt.values({key: bindparam(key) for key in keys}), params
+
+    async def _write(self, batch: dict) -> None:
+        async with AsyncSessionLocal() as session:
+            for stmt, params in self._statements(batch):
+                await session.execute(stmt, params)
+            await session.commit()
+
+    async def _write_each(self, batch: dict) -> None:
+        for task_id, entry in list(batch.items()):
+            try:
+                await self._write({task_id: entry})
+            except OperationalError:
+                raise
+            except DBAPIError:
+                logger.exception("Dropping buffered update for task %s", task_id)
+            # Written or dropped; either way it must not be retried
+            del batch[task_id]
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Write-behind flush failed; will retry")
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "flushes": self.flushes,
+            "merged": self.merged,
+        }
+
+
+task_write_buffer = TaskWriteBuffer(
+    interval_seconds=settings.task_write_behind_interval_seconds,
+    max_batch=settings.task_write_behind_max_batch,
+)
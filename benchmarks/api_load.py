@@ -0,0 +1,285 @@
+"""Load-test the API in-process and report per-endpoint latency as JSON.
+
+Seeds a throwaway SQLite database with ``--users`` users owning
+``--tasks-per-user`` tasks each, then drives the ASGI app through httpx's
+ASGITransport. Each scenario runs for ``--duration`` seconds on its own
+and the ``mixed`` phase runs all of them at once:
+
+* ``list``: GET /tasks with random filters, sort columns and orders
+* ``deep_pagination``: an offset page near the end of the list, and a
+  full cursor walk
+* ``crud``: create, read, update and delete one task
+* ``login``: bursts of POST /auth/login
+
+For every endpoint the report gives request count, throughput, error count
+and p50/p95/p99 latency. The run is reproducible for a given ``--seed``.
+
+    python -m benchmarks.api_load
+    python -m benchmarks.api_load --users 50 --tasks-per-user 1000 --duration 10
+    python -m benchmarks.api_load --scenarios list crud --concurrency 16
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from benchmarks.common import migrate, percentiles
+
+PASSWORD = "benchmark-password"
+STATUSES = ("todo", "in_progress", "done")
+PRIORITIES = ("low", "medium", "high", "urgent")
+SORT_COLUMNS = ("created_at", "due_date", "title", "priority", "status")
+
+
+class Recorder:
+    """Latency samples and error counts keyed by endpoint name."""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def call(self, endpoint: str, request):
+        started = time.perf_counter()
+        response = await request
+        self.samples[endpoint].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+        return response
+
+    def report(self, duration: float) -> dict:
+        return {
+            endpoint: {
+                "requests_per_sec": round(len(samples) / duration, 1),
+                "errors": self.errors.get(endpoint, 0),
+                **percentiles(samples),
+            }
+            for endpoint, samples in sorted(self.samples.items())
+        }
+
+
+async def seed(args, rng: random.Random) -> list[dict]:
+    """Insert users and tasks directly and mint an access token per user."""
+    import bcrypt
+    from sqlalchemy import insert
+
+    from app.database import AsyncSessionLocal
+    from app.models import Task, User
+    from app.routers.auth import create_access_token
+
+    hashed = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(rounds=args.rounds)).decode()
+    now = datetime.utcnow()
+    users = []
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            insert(User).returning(User.id, User.email),
+            [
+                {"email": f"user{i}@bench.example.com", "hashed_password": hashed}
+                for i in range(args.users)
+            ],
+        )
+        for user_id, email in result.all():
+            token = create_access_token({"sub": str(user_id), "role": "user"})
+            users.append({
+                "id": user_id,
+                "email": email,
+                "headers": {"Authorization": f"Bearer {token}"},
+            })
+
+        rows = [
+            {
+                "user_id": user["id"],
+                "title": f"task {n} for user {user['id']}",
+                "description": "seeded by benchmarks.api_load",
+                "status": rng.choice(STATUSES),
+                "priority": rng.choice(PRIORITIES),
+                "due_date": (
+                    now + timedelta(hours=rng.randint(-24 * 30, 24 * 30))
+                    if rng.random() < 0.7 else None
+                ),
+            }
+            for user in users
+            for n in range(args.tasks_per_user)
+        ]
+        for start in range(0, len(rows), 5000):
+            await db.execute(insert(Task), rows[start:start + 5000])
+        await db.commit()
+    return users
+
+
+async def list_tasks(client, users, rng, recorder, stop_at):
+    while time.perf_counter() < stop_at:
+        user = rng.choice(users)
+        params = {
+            "sort_by": rng.choice(SORT_COLUMNS),
+            "order": rng.choice(("asc", "desc")),
+            "page_size": rng.choice((10, 20, 50)),
+        }
+        if rng.random() < 0.5:
+            params["status"] = rng.choice(STATUSES)
+        if rng.random() < 0.3:
+            params["priority"] = rng.choice(PRIORITIES)
+        await recorder.call(
+            "GET /tasks", client.get("/tasks/", params=params, headers=user["headers"])
+        )
+
+
+async def deep_pagination(client, users, rng, recorder, stop_at, tasks_per_user):
+    page_size = 50
+    last_page = max(1, tasks_per_user // page_size)
+    while time.perf_counter() < stop_at:
+        user = rng.choice(users)
+        await recorder.call(
+            "GET /tasks (deep offset page)",
+            client.get(
+                "/tasks/",
+                params={"page": last_page, "page_size": page_size},
+                headers=user["headers"],
+            ),
+        )
+
+        params = {"pagination": "cursor", "page_size": page_size}
+        while time.perf_counter() < stop_at:
+            response = await recorder.call(
+                "GET /tasks (cursor page)",
+                client.get("/tasks/", params=params, headers=user["headers"]),
+            )
+            next_cursor = response.json().get("next_cursor") if response.is_success else None
+            if next_cursor is None:
+                break
+            params["cursor"] = next_cursor
+
+
+async def crud(client, users, rng, recorder, stop_at):
+    n = 0
+    while time.perf_counter() < stop_at:
+        headers = rng.choice(users)["headers"]
+        response = await recorder.call(
+            "POST /tasks",
+            client.post(
+                "/tasks/",
+                json={"title": f"churn {n}", "priority": rng.choice(PRIORITIES)},
+                headers=headers,
+            ),
+        )
+        n += 1
+        if not response.is_success:
+            continue
+        task_id = response.json()["id"]
+        await recorder.call("GET /tasks/{id}", client.get(f"/tasks/{task_id}", headers=headers))
+        await recorder.call(
+            "PATCH /tasks/{id}",
+            client.patch(
+                f"/tasks/{task_id}", json={"status": rng.choice(STATUSES)}, headers=headers
+            ),
+        )
+        await recorder.call("DELETE /tasks/{id}", client.delete(f"/tasks/{task_id}", headers=headers))
+
+
+async def login(client, users, rng, recorder, stop_at, burst_size):
+    while time.perf_counter() < stop_at:
+        burst = [rng.choice(users) for _ in range(burst_size)]
+        await asyncio.gather(*(
+            recorder.call(
+                "POST /auth/login",
+                client.post("/auth/login", json={"email": user["email"], "password": PASSWORD}),
+            )
+            for user in burst
+        ))
+        await asyncio.sleep(0.05)
+
+
+def _workers(name, client, users, args, recorder, stop_at, count):
+    """Build ``count`` client loops for one scenario, each with its own RNG."""
+    loops = []
+    for i in range(count):
+        rng = random.Random(f"{args.seed}-{name}-{i}")
+        if name == "list":
+            loops.append(list_tasks(client, users, rng, recorder, stop_at))
+        elif name == "deep_pagination":
+            loops.append(deep_pagination(
+                client, users, rng, recorder, stop_at, args.tasks_per_user
+            ))
+        elif name == "crud":
+            loops.append(crud(client, users, rng, recorder, stop_at))
+        elif name == "login":
+            loops.append(login(client, users, rng, recorder, stop_at, args.login_burst))
+    return loops
+
+
+SCENARIOS = ("list", "deep_pagination", "crud", "login")
+
+
+async def main(args) -> dict:
+    import httpx
+
+    from app.database import engine
+    from app.main import app
+
+    rng = random.Random(args.seed)
+    seed_started = time.perf_counter()
+    users = await seed(args, rng)
+    report = {"seed_seconds": round(time.perf_counter() - seed_started, 2)}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in args.scenarios:
+            recorder = Recorder()
+            stop_at = time.perf_counter() + args.duration
+            await asyncio.gather(
+                *_workers(name, client, users, args, recorder, stop_at, args.concurrency)
+            )
+            report[name] = recorder.report(args.duration)
+
+        if args.mixed:
+            # Split the clients across scenarios, one client minimum each
+            recorder = Recorder()
+            stop_at = time.perf_counter() + args.duration
+            per_scenario = max(1, args.concurrency // len(args.scenarios))
+            await asyncio.gather(*(
+                loop
+                for name in args.scenarios
+                for loop in _workers(
+                    name, client, users, args, recorder, stop_at, per_scenario
+                )
+            ))
+            report["mixed"] = recorder.report(args.duration)
+
+    await engine.dispose()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20, help="users to seed")
+    parser.add_argument("--tasks-per-user", type=int, default=500, help="tasks seeded per user")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per phase")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent clients per phase")
+    parser.add_argument("--login-burst", type=int, default=8, help="logins fired together")
+    parser.add_argument("--rounds", type=int, default=10, help="bcrypt cost of seeded passwords")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for data and request mix")
+    parser.add_argument(
+        "--scenarios", nargs="+", default=list(SCENARIOS), choices=SCENARIOS,
+        help="scenarios to run, each on its own",
+    )
+    parser.add_argument(
+        "--no-mixed", dest="mixed", action="store_false",
+        help="skip the phase that runs every scenario at once",
+    )
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="api_load_")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir}/bench.db"
+    # Every in-process client shares one "IP"; measure the app, not the limiter
+    os.environ["RATE_LIMIT_BACKEND"] = "none"
+    migrate()
+
+    result = asyncio.run(main(args))
+    result["config"] = vars(args)
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
@@ -0,0 +1,74 @@
+"""Measure the per-request cost of the get_current_user dependency.
+
+Calls the dependency directly (no HTTP) with the principal already cached,
+so what remains is token verification. ``full_verify`` disables the
+verified-token cache, which is how every request paid before it existed;
+``cached`` is the fast path for a token seen before.
+
+    python -m benchmarks.auth_dependency
+    python -m benchmarks.auth_dependency --calls 50000 --tokens 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.common import percentiles
+
+
+async def main(args) -> dict:
+    from app.database import AsyncSessionLocal
+    from app.principals import Principal, principal_cache
+    from app.models import UserRole
+    from app.routers.auth import create_access_token, get_current_user
+    from app.tokens import token_cache
+
+    tokens = []
+    for user_id in range(1, args.tokens + 1):
+        principal_cache.put(Principal(id=user_id, role=UserRole.user, is_active=True))
+        tokens.append(create_access_token({"sub": str(user_id), "role": "user"}))
+
+    # The principal is cached, so the session never opens a connection; the
+    # dependency only tags it with the caller's id
+    db = AsyncSessionLocal()
+
+    report = {}
+    for name, cache_size in (("full_verify", 0), ("cached", args.tokens)):
+        token_cache.max_size = cache_size
+        token_cache.clear()
+        for token in tokens:
+            await get_current_user(db=db, token=token)
+
+        samples: list[float] = []
+        started = time.perf_counter()
+        for i in range(args.calls):
+            token = tokens[i % len(tokens)]
+            call_started = time.perf_counter()
+            await get_current_user(db=db, token=token)
+            samples.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+        report[name] = {
+            "calls_per_sec": round(args.calls / elapsed),
+            "mean_us": round(sum(samples) / len(samples) * 1e6, 2),
+            **percentiles(samples),
+        }
+    report["speedup"] = round(report["full_verify"]["mean_us"] / report["cached"]["mean_us"], 1)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000, help="dependency calls per mode")
+    parser.add_argument("--tokens", type=int, default=50, help="distinct users/tokens in rotation")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="auth_dependency_")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir}/bench.db"
+
+    result = asyncio.run(main(args))
+    result["config"] = vars(args)
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
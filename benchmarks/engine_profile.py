@@ -0,0 +1,142 @@
+"""Compare mixed read/write throughput across database engine profiles.
+
+Each profile runs in its own subprocess (settings are read at import time)
+against a fresh SQLite file. Readers list tasks while writers create and
+update them; the JSON report gives operations per second and latency
+percentiles for each profile.
+
+    python -m benchmarks.engine_profile
+    python -m benchmarks.engine_profile --duration 10 --readers 8 --writers 4
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import migrate, percentiles
+
+# The engine as it was before profiles existed: echo on, rollback journal,
+# synchronous=FULL and no extra caching.
+PROFILES = {
+    "legacy": {
+        "DATABASE_ECHO": "true",
+        "DATABASE_POOL_PRE_PING": "false",
+        "SQLITE_JOURNAL_MODE": "DELETE",
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_CACHE_SIZE": "-2000",
+        "SQLITE_MMAP_SIZE": "0",
+    },
+    "tuned": {},
+}
+
+
+async def _reader(client, headers, stop_at: float, samples: list[float]):
+    while time.perf_counter() < stop_at:
+        started = time.perf_counter()
+        response = await client.get("/tasks/", params={"page_size": 20}, headers=headers)
+        samples.append(time.perf_counter() - started)
+        response.raise_for_status()
+
+
+async def _writer(client, headers, stop_at: float, samples: list[float]):
+    n = 0
+    while time.perf_counter() < stop_at:
+        started = time.perf_counter()
+        response = await client.post("/tasks/", json={"title": f"write {n}"}, headers=headers)
+        response.raise_for_status()
+        task_id = response.json()["id"]
+        response = await client.patch(
+            f"/tasks/{task_id}", json={"status": "in_progress"}, headers=headers
+        )
+        response.raise_for_status()
+        samples.append(time.perf_counter() - started)
+        n += 1
+
+
+async def run_profile(args) -> dict:
+    import httpx
+
+    from app.database import engine
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        credentials = {"email": "bench@example.com", "password": "benchmark-password"}
+        (await client.post("/auth/register", json=credentials)).raise_for_status()
+        login = await client.post("/auth/login", json=credentials)
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        for start in range(0, args.seed_tasks, 500):
+            batch = [{"title": f"seed {i}"} for i in range(start, min(start + 500, args.seed_tasks))]
+            (await client.post("/tasks/bulk", json=batch, headers=headers)).raise_for_status()
+
+        reads: list[float] = []
+        writes: list[float] = []
+        stop_at = time.perf_counter() + args.duration
+        await asyncio.gather(
+            *(_reader(client, headers, stop_at, reads) for _ in range(args.readers)),
+            *(_writer(client, headers, stop_at, writes) for _ in range(args.writers)),
+        )
+
+    await engine.dispose()
+    return {
+        "reads_per_sec": round(len(reads) / args.duration, 1),
+        "writes_per_sec": round(len(writes) / args.duration, 1),
+        "read_latency": percentiles(reads),
+        "write_latency": percentiles(writes),
+    }
+
+
+def main(args) -> dict:
+    report = {}
+    for name in args.profiles:
+        workdir = tempfile.mkdtemp(prefix=f"engine_{name}_")
+        env = {
+            **os.environ,
+            **PROFILES[name],
+            "DATABASE_URL": f"sqlite+aiosqlite:///{workdir}/bench.db",
+            "RATE_LIMIT_BACKEND": "none",
+        }
+        command = [sys.executable, "-m", "benchmarks.engine_profile", "--run-profile", name]
+        command += [
+            "--duration", str(args.duration),
+            "--readers", str(args.readers),
+            "--writers", str(args.writers),
+            "--seed-tasks", str(args.seed_tasks),
+        ]
+        # echo=True logs SQL to stdout, so results come back through a file
+        output = os.path.join(workdir, "result.json")
+        command += ["--output", output]
+        subprocess.run(
+            command, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        with open(output) as f:
+            report[name] = json.load(f)
+    report["config"] = {
+        k: v for k, v in vars(args).items() if k not in ("run_profile", "output")
+    }
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per profile")
+    parser.add_argument("--readers", type=int, default=4, help="concurrent list clients")
+    parser.add_argument("--writers", type=int, default=4, help="concurrent create/update clients")
+    parser.add_argument("--seed-tasks", type=int, default=2000, help="tasks created up front")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    parser.add_argument("--run-profile", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_profile:
+        os.environ.setdefault("BCRYPT_ROUNDS", "4")
+        migrate()
+        with open(args.output, "w") as f:
+            json.dump(asyncio.run(run_profile(args)), f)
+    else:
+        json.dump(main(args), sys.stdout, indent=2)
+        sys.stdout.write("\n")
@@ -0,0 +1,97 @@
+"""Measure GET /tasks latency while a concurrent login storm is running.
+
+Drives the ASGI app in-process against a throwaway SQLite database and
+prints a JSON report with /tasks latency percentiles, first on a quiet
+server and then while many clients hammer POST /auth/login.
+
+    python -m benchmarks.login_storm                # bcrypt on the pool
+    python -m benchmarks.login_storm --workers 0    # bcrypt inline (old path)
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.common import migrate, percentiles
+
+
+async def _list_tasks(client, headers, stop_at: float, samples: list[float]):
+    while time.perf_counter() < stop_at:
+        started = time.perf_counter()
+        response = await client.get("/tasks/", headers=headers)
+        samples.append(time.perf_counter() - started)
+        response.raise_for_status()
+
+
+async def _login(client, credentials, stop_at: float, outcomes: dict):
+    while time.perf_counter() < stop_at:
+        response = await client.post("/auth/login", json=credentials)
+        outcomes[response.status_code] = outcomes.get(response.status_code, 0) + 1
+        if response.status_code == 503:
+            await asyncio.sleep(0.01)
+
+
+async def main(args) -> dict:
+    import httpx
+
+    from app.database import engine
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        credentials = {"email": "bench@example.com", "password": "benchmark-password"}
+        (await client.post("/auth/register", json=credentials)).raise_for_status()
+        login = await client.post("/auth/login", json=credentials)
+        login.raise_for_status()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        for i in range(50):
+            await client.post("/tasks/", json={"title": f"task {i}"}, headers=headers)
+
+        report = {}
+
+        quiet: list[float] = []
+        stop_at = time.perf_counter() + args.duration
+        await asyncio.gather(
+            *(_list_tasks(client, headers, stop_at, quiet) for _ in range(args.readers))
+        )
+        report["tasks_quiet"] = percentiles(quiet)
+
+        storm: list[float] = []
+        outcomes: dict = {}
+        stop_at = time.perf_counter() + args.duration
+        await asyncio.gather(
+            *(_list_tasks(client, headers, stop_at, storm) for _ in range(args.readers)),
+            *(_login(client, credentials, stop_at, outcomes) for _ in range(args.logins)),
+        )
+        report["tasks_during_login_storm"] = percentiles(storm)
+        report["login_status_codes"] = {str(k): v for k, v in sorted(outcomes.items())}
+
+    await engine.dispose()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per phase")
+    parser.add_argument("--readers", type=int, default=4, help="concurrent /tasks clients")
+    parser.add_argument("--logins", type=int, default=32, help="concurrent login clients")
+    parser.add_argument("--workers", type=int, default=None, help="bcrypt pool size (0 = inline)")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="login_storm_")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir}/bench.db"
+    # Every in-process client shares one "IP"; measure the app, not the limiter
+    os.environ["RATE_LIMIT_BACKEND"] = "none"
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    if args.workers is not None:
+        os.environ["PASSWORD_HASH_WORKERS"] = str(args.workers)
+    migrate()
+
+    result = asyncio.run(main(args))
+    result["config"] = vars(args)
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
@@ -0,0 +1,134 @@
+"""Compare GET /tasks list serialization paths at several page sizes.
+
+Seeds a throwaway SQLite database, then times three ways of turning one
+page of tasks into a JSON body:
+
+* ``orm_model_dump``: ORM entities -> TaskResponse -> dict -> json.dumps
+  (the original path)
+* ``orm_adapter``: ORM entities validated and dumped by one TypeAdapter
+* ``row_fast_path``: selected column rows dumped as TaskRow dicts (what
+  GET /tasks uses now)
+
+Each path's output is checked against the others before timing.
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --sizes 10 100 1000 --iterations 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import migrate, percentiles
+
+
+async def main(args) -> dict:
+    from pydantic import TypeAdapter
+    from sqlalchemy import insert, select
+
+    from app.database import AsyncSessionLocal, engine
+    from app.models import Task, User, UserRole
+    from app.principals import Principal
+    from app.routers.task import _render_task_list
+    from app.schemas import TaskResponse
+
+    async with AsyncSessionLocal() as db:
+        user_id = (
+            await db.execute(
+                insert(User)
+                .values(email="bench@example.com", hashed_password="x")
+                .returning(User.id)
+            )
+        ).scalar_one()
+        now = datetime.utcnow()
+        await db.execute(
+            insert(Task),
+            [
+                {
+                    "user_id": user_id,
+                    "title": f"task {i}",
+                    "description": "lorem ipsum dolor sit amet " * 4,
+                    "due_date": now + timedelta(hours=i) if i % 3 else None,
+                }
+                for i in range(max(args.sizes))
+            ],
+        )
+        await db.commit()
+
+    principal = Principal(id=user_id, role=UserRole.user, is_active=True)
+    list_adapter = TypeAdapter(list[TaskResponse])
+    report = {}
+
+    async with AsyncSessionLocal() as db:
+
+        async def orm_model_dump(size: int) -> bytes:
+            result = await db.execute(
+                select(Task).where(Task.user_id == user_id)
+                .order_by(Task.created_at.desc()).limit(size)
+            )
+            tasks = result.scalars().all()
+            body = json.dumps(
+                [TaskResponse.model_validate(t).model_dump(mode="json") for t in tasks]
+            ).encode()
+            db.expunge_all()
+            return body
+
+        async def orm_adapter(size: int) -> bytes:
+            result = await db.execute(
+                select(Task).where(Task.user_id == user_id)
+                .order_by(Task.created_at.desc()).limit(size)
+            )
+            tasks = result.scalars().all()
+            body = list_adapter.dump_json(
+                list_adapter.validate_python(tasks, from_attributes=True)
+            )
+            db.expunge_all()
+            return body
+
+        async def row_fast_path(size: int) -> bytes:
+            return await _render_task_list(
+                db, principal, None, None, "created_at", "desc",
+                1, size, "offset", None,
+            )
+
+        paths = {
+            "orm_model_dump": orm_model_dump,
+            "orm_adapter": orm_adapter,
+            "row_fast_path": row_fast_path,
+        }
+        for size in args.sizes:
+            outputs = [json.loads(await fn(size)) for fn in paths.values()]
+            assert all(out == outputs[0] for out in outputs), "serializers disagree"
+
+            report[str(size)] = {}
+            for name, fn in paths.items():
+                samples: list[float] = []
+                for _ in range(args.iterations):
+                    started = time.perf_counter()
+                    await fn(size)
+                    samples.append(time.perf_counter() - started)
+                report[str(size)][name] = percentiles(samples)
+
+    await engine.dispose()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="rows per page")
+    parser.add_argument("--iterations", type=int, default=100, help="timed runs per path and size")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="serialization_")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir}/bench.db"
+    os.environ["DATABASE_ECHO"] = "false"
+    migrate()
+
+    result = asyncio.run(main(args))
+    result["config"] = vars(args)
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# app.database builds its engine at import time, so point it at a scratch
+# database before any test module imports the app
+_DB_PATH = Path(tempfile.mkdtemp()) / "test.db"
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_PATH}"
+os.environ.setdefault("RATE_LIMIT_BACKEND", "none")
+os.environ.setdefault("REMINDERS_ENABLED", "false")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def migrated_database():
+    """Build the schema the way production does: alembic upgrade head."""
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=ROOT,
+        env=os.environ,
+        check=True,
+        capture_output=True,
+    )
+    yield _DB_PATH
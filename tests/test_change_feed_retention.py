@@ -0,0 +1,61 @@
+"""Pruned change-log entries turn a stale ``since`` into 410 Gone."""
+import asyncio
+
+import httpx
+from sqlalchemy import text
+
+from app.change_feed import change_log_pruner
+from app.database import AsyncSessionLocal
+from app.main import app
+
+
+async def _prune_and_read() -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        credentials = {"email": "retention@example.com", "password": "password1"}
+        await client.post("/auth/register", json=credentials)
+        login = await client.post("/auth/login", json=credentials)
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        ids = [
+            (await client.post("/tasks/", json={"title": f"kept {n}"}, headers=headers)).json()["id"]
+            for n in range(3)
+        ]
+        feed = (await client.get("/tasks/changes", headers=headers)).json()
+        seqs = {change["task_id"]: change["seq"] for change in feed["changes"]}
+
+        # Age everything up to the first task's entry past the retention window
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                text("UPDATE task_changes SET changed_at = '2000-01-01 00:00:00' WHERE seq <= :seq"),
+                {"seq": seqs[ids[0]]},
+            )
+            await session.commit()
+        pruned = await change_log_pruner.prune()
+
+        return {
+            "ids": ids,
+            "seqs": seqs,
+            "pruned": pruned,
+            "stale": await client.get("/tasks/changes", params={"since": 0}, headers=headers),
+            "stale_stream": await client.get(
+                "/tasks/changes/stream", params={"since": 0}, headers=headers
+            ),
+            "resumed": await client.get(
+                "/tasks/changes", params={"since": seqs[ids[0]]}, headers=headers
+            ),
+        }
+
+
+def test_since_before_the_pruned_seq_is_gone():
+    result = asyncio.run(_prune_and_read())
+    ids, seqs = result["ids"], result["seqs"]
+
+    assert result["pruned"] >= 1
+    assert result["stale"].status_code == 410
+    assert result["stale"].headers["X-Change-Feed-Pruned-Through"] == str(seqs[ids[0]])
+    assert result["stale_stream"].status_code == 410
+
+    resumed = result["resumed"]
+    assert resumed.status_code == 200
+    assert [change["task_id"] for change in resumed.json()["changes"]] == ids[1:]
@@ -0,0 +1,34 @@
+"""Engine instrumentation must not leak state on statements that raise."""
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import metrics
+
+
+async def _run_failing_statement(path) -> tuple[list, list]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    metrics.instrument_engine(engine)
+    try:
+        async with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                await conn.execute(text("SELECT * FROM no_such_table"))
+            after_error = list(conn.info["metrics_started"])
+            await conn.execute(text("SELECT 1"))
+            after_success = list(conn.info["metrics_started"])
+    finally:
+        await engine.dispose()
+    return after_error, after_success
+
+
+def test_failed_statement_is_popped_and_counted(tmp_path):
+    errors_before = metrics.db_statement_errors._values.get(("OperationalError",), 0)
+
+    after_error, after_success = asyncio.run(_run_failing_statement(tmp_path / "metrics.db"))
+
+    assert after_error == []
+    assert after_success == []
+    assert metrics.db_statement_errors._values[("OperationalError",)] == errors_before + 1
@@ -0,0 +1,27 @@
+"""The SQLite rate limiter must not stall the event loop on a locked file."""
+import sqlite3
+import time
+
+from app.rate_limit import SQLiteRateLimitBackend
+
+
+def test_locked_file_fails_open_without_waiting(tmp_path):
+    path = str(tmp_path / "rate_limits.db")
+    backend = SQLiteRateLimitBackend(path)
+    assert backend.hit("user:1", capacity=1, rate=0.001) == 0.0
+    assert backend.hit("user:1", capacity=1, rate=0.001) > 0
+
+    # Another worker holding the write lock
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        started = time.perf_counter()
+        wait = backend.hit("user:1", capacity=1, rate=0.001)
+        elapsed = time.perf_counter() - started
+    finally:
+        other.execute("ROLLBACK")
+        other.close()
+
+    assert wait == 0.0
+    assert elapsed < 0.1
+    assert backend.stats() == {"rejected": 1, "busy": 1}
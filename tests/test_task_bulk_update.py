@@ -0,0 +1,59 @@
+"""PATCH /tasks/bulk reports per-item outcomes, even for invalid items."""
+import asyncio
+
+import httpx
+
+from app.main import app
+
+
+async def _bulk_patch() -> tuple[list, dict]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        credentials = {"email": "bulk-owner@example.com", "password": "password1"}
+        await client.post("/auth/register", json=credentials)
+        login = await client.post("/auth/login", json=credentials)
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        created = await client.post(
+            "/tasks/bulk", json=[{"title": f"bulk {n}"} for n in range(4)], headers=headers
+        )
+        ids = [result["id"] for result in created.json()["results"]]
+        before = {
+            task_id: (await client.get(f"/tasks/{task_id}", headers=headers)).json()
+            for task_id in ids
+        }
+
+        response = await client.patch(
+            "/tasks/bulk",
+            json=[
+                {"id": ids[0], "status": "done"},
+                {"id": ids[1], "title": None},
+                {"id": ids[2], "priority": None, "status": "in_progress"},
+                {"id": ids[3]},
+            ],
+            headers=headers,
+        )
+        assert response.status_code == 200, response.text
+
+        after = {
+            task_id: (await client.get(f"/tasks/{task_id}", headers=headers)).json()
+            for task_id in ids
+        }
+    return response.json()["results"], {"before": before, "after": after, "ids": ids}
+
+
+def test_null_items_are_invalid_and_do_not_block_the_rest():
+    results, state = asyncio.run(_bulk_patch())
+    ids, before, after = state["ids"], state["before"], state["after"]
+
+    assert [result["status"] for result in results] == ["updated", "invalid", "invalid", "updated"]
+    assert results[1]["detail"] == "May not be null: title"
+    assert results[2]["detail"] == "May not be null: priority"
+    assert results[0]["task"]["status"] == "done"
+
+    assert after[ids[0]]["status"] == "done"
+    # Invalid items are left out of the UPDATE entirely
+    assert after[ids[1]] == before[ids[1]]
+    assert after[ids[2]] == before[ids[2]]
+    # An item with no fields is a read, like an empty single PATCH
+    assert after[ids[3]] == before[ids[3]]
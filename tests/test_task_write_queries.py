@@ -0,0 +1,83 @@
+"""Statement budgets for the single-task write endpoints.
+
+Each mutation is one statement on success. Only a write that matched no
+row runs a second, id-only SELECT to choose between 404 and 403.
+"""
+import asyncio
+
+import httpx
+from sqlalchemy import event
+
+from app.database import engine
+from app.main import app
+
+BUDGETS = {
+    "create": 1,
+    "update": 1,
+    "replace": 1,
+    "delete": 1,
+    "update_missing": 2,
+    "update_forbidden": 2,
+    "replace_missing": 2,
+    "replace_forbidden": 2,
+    "delete_missing": 2,
+    "delete_forbidden": 2,
+}
+
+
+async def _login(client: httpx.AsyncClient, email: str) -> dict:
+    credentials = {"email": email, "password": "password1"}
+    await client.post("/auth/register", json=credentials)
+    response = await client.post("/auth/login", json=credentials)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    # Warm the principal cache so auth itself issues no statements
+    await client.get("/tasks/changes", headers=headers)
+    return headers
+
+
+async def _measure() -> dict:
+    counts = {}
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        owner = await _login(client, "query-owner@example.com")
+        other = await _login(client, "query-other@example.com")
+        task = {"title": "counted"}
+        other_id = (await client.post("/tasks/", json=task, headers=other)).json()["id"]
+
+        async def run(name, method, url, headers, expected_status, **kwargs):
+            statements.clear()
+            event.listen(engine.sync_engine, "before_cursor_execute", count)
+            try:
+                response = await client.request(method, url, headers=headers, **kwargs)
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", count)
+            assert response.status_code == expected_status, (name, response.text)
+            counts[name] = len(statements)
+            return response
+
+        created = await run("create", "POST", "/tasks/", owner, 201, json=task)
+        task_id = created.json()["id"]
+        await run("update", "PATCH", f"/tasks/{task_id}", owner, 200, json={"status": "done"})
+        await run("replace", "PUT", f"/tasks/{task_id}", owner, 200, json=task)
+        await run("delete", "DELETE", f"/tasks/{task_id}", owner, 204)
+
+        for action, method, body in (
+            ("update", "PATCH", {"status": "done"}),
+            ("replace", "PUT", task),
+            ("delete", "DELETE", None),
+        ):
+            kwargs = {} if body is None else {"json": body}
+            await run(f"{action}_missing", method, "/tasks/999999", owner, 404, **kwargs)
+            await run(f"{action}_forbidden", method, f"/tasks/{other_id}", owner, 403, **kwargs)
+    return counts
+
+
+def test_task_writes_stay_within_statement_budget():
+    counts = asyncio.run(_measure())
+
+    assert counts == BUDGETS